@@ -1,7 +1,9 @@
 """env_loader_pro — enterprise-ready typed environment loader"""
 
+from importlib import import_module
+
 # Core exports
-from .core.loader import load_env
+from .core.loader import load_env, load_env_with_audit
 from .exceptions import (
     ConfigurationError,
     DecryptionError,
@@ -14,50 +16,6 @@ from .exceptions import (
 # Schema support (backward compatibility)
 from .schema import load_with_schema
 
-# Exporters
-from .exporters import (
-    export_configmap,
-    export_kubernetes,
-    export_secret,
-    export_tfvars,
-    export_tfvars_json,
-    generate_env_example,
-)
-
-# Provider exports
-try:
-    from .providers import (
-        BaseProvider,
-        AzureKeyVaultProvider,
-        AWSSecretsManagerProvider,
-        AWSSSMProvider,
-        DockerSecretsProvider,
-        FilesystemProvider,
-        KubernetesSecretsProvider,
-    )
-    PROVIDERS_AVAILABLE = True
-except ImportError:
-    PROVIDERS_AVAILABLE = False
-    BaseProvider = None
-
-# Integration exports
-try:
-    from .integrations.fastapi import config_dependency, inject_config
-    FASTAPI_AVAILABLE = True
-except ImportError:
-    FASTAPI_AVAILABLE = False
-    config_dependency = None
-    inject_config = None
-
-# Watch exports
-try:
-    from .watch import ConfigReloader, create_reloader
-    WATCH_AVAILABLE = True
-except ImportError:
-    WATCH_AVAILABLE = False
-    ConfigReloader = None
-    create_reloader = None
-
 # Core utilities
 from .core import (
     AuditEntry,
@@ -80,19 +38,6 @@ from .core import (
     load_policy,
 )
 
-# Crypto utilities
-try:
-    from .crypto import decrypt_file, encrypt_file, re_encrypt_file
-    CRYPTO_AVAILABLE = True
-except ImportError:
-    CRYPTO_AVAILABLE = False
-    decrypt_file = None
-    encrypt_file = None
-    re_encrypt_file = None
-
-# Provider metadata
-from .providers.base import ProviderCapabilities, SecretMetadata
-
 # Utils
 from .utils import (
     detect_environment,
@@ -103,9 +48,80 @@ from .utils import (
     mask_value,
 )
 
+# Lazily imported attributes (PEP 562): name -> submodule
+_LAZY_ATTRS = {
+    # Exporters
+    "export_configmap": ".exporters",
+    "export_kubernetes": ".exporters",
+    "export_secret": ".exporters",
+    "export_tfvars": ".exporters",
+    "export_tfvars_json": ".exporters",
+    "generate_env_example": ".exporters",
+    # Providers
+    "BaseProvider": ".providers",
+    "AzureKeyVaultProvider": ".providers",
+    "AWSSecretsManagerProvider": ".providers",
+    "AWSSSMProvider": ".providers",
+    "DockerSecretsProvider": ".providers",
+    "FilesystemProvider": ".providers",
+    "KubernetesSecretsProvider": ".providers",
+    "ProviderCapabilities": ".providers.base",
+    "SecretMetadata": ".providers.base",
+    # Integrations
+    "config_dependency": ".integrations.fastapi",
+    "inject_config": ".integrations.fastapi",
+    # Watch
+    "ConfigReloader": ".watch",
+    "create_reloader": ".watch",
+    # Crypto utilities
+    "bulk_decrypt_files": ".crypto",
+    "decrypt_file": ".crypto",
+    "encrypt_file": ".crypto",
+    "re_encrypt_file": ".crypto",
+}
+
+# Optional subsystems: resolve to None (flag False) if they fail to import
+_OPTIONAL_MODULES = {
+    "PROVIDERS_AVAILABLE": ".providers",
+    "FASTAPI_AVAILABLE": ".integrations.fastapi",
+    "WATCH_AVAILABLE": ".watch",
+    "CRYPTO_AVAILABLE": ".crypto",
+}
+
+
+def __getattr__(name):
+    """Import optional subsystems on first attribute access."""
+    if name in _OPTIONAL_MODULES:
+        try:
+            import_module(_OPTIONAL_MODULES[name], __name__)
+            value = True
+        except ImportError:
+            value = False
+    elif name in _LAZY_ATTRS:
+        module_name = _LAZY_ATTRS[name]
+        try:
+            value = getattr(import_module(module_name, __name__), name)
+        except ImportError:
+            if module_name not in _OPTIONAL_MODULES.values():
+                raise
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_OPTIONAL_MODULES))
+
+
+# Star imports cover the core API only; optional subsystems (providers,
+# integrations, watch, crypto) stay lazy and must be imported by name
 __all__ = [
     # Core API
     "load_env",
+    "load_env_with_audit",
     "load_with_schema",
     # Exceptions
     "EnvLoaderError",
@@ -152,36 +168,6 @@ __all__ = [
     "get_recommended_providers",
 ]
 
-if PROVIDERS_AVAILABLE:
-    __all__.extend([
-        "BaseProvider",
-        "AzureKeyVaultProvider",
-        "AWSSecretsManagerProvider",
-        "AWSSSMProvider",
-        "DockerSecretsProvider",
-        "KubernetesSecretsProvider",
-        "FilesystemProvider",
-    ])
-
-if FASTAPI_AVAILABLE:
-    __all__.extend([
-        "config_dependency",
-        "inject_config",
-    ])
-
-if WATCH_AVAILABLE:
-    __all__.extend([
-        "ConfigReloader",
-        "create_reloader",
-    ])
-
-if CRYPTO_AVAILABLE:
-    __all__.extend([
-        "decrypt_file",
-        "encrypt_file",
-        "re_encrypt_file",
-    ])
-
 __version__ = "1.0.1"
 
 
@@ -2,81 +2,175 @@
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="env-loader-pro: Typed, validated environment variable loader"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Show command
+from .utils.serialization import dumps_json
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON (see ``utils.serialization.dumps_json``)."""
+    return dumps_json(obj).decode("utf-8")
+
+def _build_show(subparsers):
     show_parser = subparsers.add_parser("show", help="Show environment variables")
     show_parser.add_argument("--env", help="Environment name (e.g., dev, prod)")
     show_parser.add_argument("--path", default=".env", help="Path to .env file")
     show_parser.add_argument("--format", choices=["json", "yaml", "pretty"], default="pretty")
     show_parser.add_argument("--unmask", action="store_true", help="Show unmasked values")
-    
-    # Export command
+
+def _build_export(subparsers):
     export_parser = subparsers.add_parser("export", help="Export config to file")
     export_parser.add_argument("--env", help="Environment name")
     export_parser.add_argument("--path", default=".env", help="Path to .env file")
     export_parser.add_argument("--format", choices=["json", "yaml"], default="json")
     export_parser.add_argument("--output", required=True, help="Output file path")
-    
-    # Validate command
+
+def _build_validate(subparsers):
     validate_parser = subparsers.add_parser("validate", help="Validate environment variables")
     validate_parser.add_argument("--env", help="Environment name")
     validate_parser.add_argument("--path", default=".env", help="Path to .env file")
     validate_parser.add_argument("--required", nargs="+", help="Required variables")
     validate_parser.add_argument("--ci", action="store_true", help="CI mode: no cloud access, fail on errors")
     validate_parser.add_argument("--strict", action="store_true", help="Enable strict mode")
-    
-    # Audit command
+
+def _build_audit(subparsers):
     audit_parser = subparsers.add_parser("audit", help="Show configuration audit trail")
     audit_parser.add_argument("--env", help="Environment name")
     audit_parser.add_argument("--path", default=".env", help="Path to .env file")
     audit_parser.add_argument("--json", action="store_true", help="Output as JSON")
     audit_parser.add_argument("--ci", action="store_true", help="CI mode: no cloud access")
-    
-    # Explain command
+
+def _build_explain(subparsers):
     explain_parser = subparsers.add_parser("explain", help="Explain configuration precedence and policies")
     explain_parser.add_argument("--env", help="Environment name")
     explain_parser.add_argument("--path", default=".env", help="Path to .env file")
     explain_parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
-    
-    # Diff command (Phase 3)
+
+def _build_diff(subparsers):
     diff_parser = subparsers.add_parser("diff", help="Compare configuration changes")
     diff_parser.add_argument("--env", help="Environment name")
     diff_parser.add_argument("--path", default=".env", help="Path to .env file")
     diff_parser.add_argument("--baseline", help="Baseline configuration file")
     diff_parser.add_argument("--deny-secret-changes", action="store_true", help="Fail if secrets added/removed")
     diff_parser.add_argument("--ci", action="store_true", help="CI mode: no cloud access")
-    
-    # Encrypt/decrypt commands
+
+def _build_encrypt(subparsers):
     encrypt_parser = subparsers.add_parser("encrypt", help="Encrypt .env file")
     encrypt_parser.add_argument("input", help="Input file path")
     encrypt_parser.add_argument("--output", help="Output file path")
     encrypt_parser.add_argument("--method", choices=["age", "gpg"], default="age", help="Encryption method")
     encrypt_parser.add_argument("--key", help="Path to encryption key")
-    
+
+def _build_decrypt(subparsers):
     decrypt_parser = subparsers.add_parser("decrypt", help="Decrypt .env file")
     decrypt_parser.add_argument("input", help="Input encrypted file path")
     decrypt_parser.add_argument("--output", help="Output file path")
     decrypt_parser.add_argument("--key", help="Path to decryption key")
-    
-    # Generate example command
+
+def _build_generate_example(subparsers):
     gen_parser = subparsers.add_parser("generate-example", help="Generate .env.example file")
     gen_parser.add_argument("--output", default=".env.example", help="Output file path")
     gen_parser.add_argument("--required", nargs="+", help="Required variables")
     gen_parser.add_argument("--optional", nargs="+", help="Optional variables")
-    
-    # Dashboard command
+
+def _build_dashboard(subparsers):
     dashboard_parser = subparsers.add_parser("dashboard", help="Interactive configuration dashboard")
     dashboard_parser.add_argument("--env", help="Environment name")
     dashboard_parser.add_argument("--path", default=".env", help="Path to .env file")
     dashboard_parser.add_argument("--trace", action="store_true", help="Show variable origins")
+
+# Subcommand parser builders, in help order
+_SUBCMD_BUILDERS = {
+    "show": _build_show,
+    "export": _build_export,
+    "validate": _build_validate,
+    "audit": _build_audit,
+    "explain": _build_explain,
+    "diff": _build_diff,
+    "encrypt": _build_encrypt,
+    "decrypt": _build_decrypt,
+    "generate-example": _build_generate_example,
+    "dashboard": _build_dashboard,
+}
+
+# Source precedence shown by `explain`: (priority, source, JSON description, text description)
+_PRECEDENCE = (
+    (1, "cloud_providers", "Azure Key Vault, AWS Secrets Manager",
+     "Cloud providers (Azure Key Vault, AWS Secrets Manager)"),
+    (2, "system", "System environment variables", "System environment variables"),
+    (3, "docker_k8s", "Docker/K8s mounted secrets", "Docker/K8s mounted secrets"),
+    (4, "env_specific", ".env.{env} file", ".env.{env} (environment-specific file)"),
+    (5, "base_file", "Base .env file", "Base .env file"),
+    (6, "schema_defaults", "Schema default values", "Schema default values"),
+)
+
+_POLICY_DESCRIPTIONS = {
+    "fail": "Raise error on failure",
+    "warn": "Log warning and continue",
+    "fallback": "Silently continue (use fallback)",
+}
+
+@lru_cache(maxsize=1)
+def _default_policies():
+    from .core.policy import create_default_policies
+    return create_default_policies()
+
+# Static top-level help, printed without building the argparse tree
+_SHORT_HELP = """\
+usage: envloader [-h] [--version] <command> ...
+
+env-loader-pro: Typed, validated environment variable loader
+
+commands:
+  show                Show environment variables
+  export              Export config to file
+  validate            Validate environment variables
+  audit               Show configuration audit trail
+  explain             Explain configuration precedence and policies
+  diff                Compare configuration changes
+  encrypt             Encrypt .env file
+  decrypt             Decrypt .env file
+  generate-example    Generate .env.example file
+  dashboard           Interactive configuration dashboard
+
+options:
+  -h, --help          show this help message and exit
+  --version           show program's version number and exit
+
+Run 'envloader <command> -h' for command options.
+"""
+
+def _print_short_help():
+    sys.stdout.write(_SHORT_HELP)
+
+def main():
+    # Fast paths: no arguments, top-level help and version
+    argv = sys.argv[1:]
+    if not argv:
+        _print_short_help()
+        sys.exit(1)
+    if argv[0] in ("--version", "-V"):
+        from . import __version__
+        print(f"envloader {__version__}")
+        sys.exit(0)
+    if argv[0] in ("-h", "--help"):
+        _print_short_help()
+        sys.exit(0)
+    
+    parser = argparse.ArgumentParser(
+        description="env-loader-pro: Typed, validated environment variable loader"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Only build the requested subcommand; register all of them for help/usage output
+    command = argv[0]
+    builder = _SUBCMD_BUILDERS.get(command)
+    if builder:
+        builder(subparsers)
+    else:
+        for build in _SUBCMD_BUILDERS.values():
+            build(subparsers)
     
     args = parser.parse_args()
     
@@ -85,26 +179,7 @@ def main():
         sys.exit(1)
     
     try:
-        if args.command == "show":
-            cmd_show(args)
-        elif args.command == "export":
-            cmd_export(args)
-        elif args.command == "validate":
-            cmd_validate(args)
-        elif args.command == "generate-example":
-            cmd_generate_example(args)
-        elif args.command == "dashboard":
-            cmd_dashboard(args)
-        elif args.command == "audit":
-            cmd_audit(args)
-        elif args.command == "explain":
-            cmd_explain(args)
-        elif args.command == "diff":
-            cmd_diff(args)
-        elif args.command == "encrypt":
-            cmd_encrypt(args)
-        elif args.command == "decrypt":
-            cmd_decrypt(args)
+        _DISPATCH[args.command](args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -119,7 +194,7 @@ def cmd_show(args):
     )
     
     if args.format == "json":
-        print(json.dumps(config.safe_repr(), indent=2))
+        print(_dumps(config.safe_repr()))
     elif args.format == "yaml":
         try:
             import yaml
@@ -152,7 +227,7 @@ def cmd_validate(args):
     failure_policy = {} if args.ci else None
     
     try:
-        result = load_env(
+        config = load_env(
             path=args.path,
             env=args.env,
             required=args.required or [],
@@ -161,12 +236,6 @@ def cmd_validate(args):
             failure_policy=failure_policy,
         )
         
-        # Handle tuple return (config, audit) if audit enabled
-        if isinstance(result, tuple):
-            config, _ = result
-        else:
-            config = result
-        
         print("✓ Validation passed")
         print(f"Found {len(config)} environment variables")
         
@@ -220,20 +289,23 @@ def cmd_dashboard(args):
     print("-" * 70)
     
     safe_config = config.safe_repr()
-    for key in sorted(safe_config.keys()):
-        value = safe_config[key]
+    width = max(30, max(map(len, safe_config), default=0))
+    trace = config.trace if args.trace and hasattr(config, 'trace') else None
+    
+    # Render all rows first, then write them in one call
+    rows = []
+    for key, value in sorted(safe_config.items()):
         value_str = str(value)
         if len(value_str) > 50:
             value_str = value_str[:47] + "..."
         
         # Show origin if tracing enabled
-        origin_info = ""
-        if args.trace and hasattr(config, 'trace'):
-            origin = config.trace(key)
-            origin_info = f" [{origin}]"
-        
-        print(f"  {key:30} = {value_str:30}{origin_info}")
+        if trace:
+            rows.append("  %-*s = %-30s [%s]\n" % (width, key, value_str, trace(key)))
+        else:
+            rows.append("  %-*s = %-30s\n" % (width, key, value_str))
     
+    sys.stdout.write("".join(rows))
     print()
     
     # Validation status
@@ -260,103 +332,83 @@ def cmd_dashboard(args):
 
 def cmd_audit(args):
     """Show configuration audit trail."""
-    from .core.loader import load_env
+    from .core.loader import load_env_with_audit
     
     # CI mode: no providers
     providers = [] if args.ci else None
     
-    result = load_env(
+    config, audit = load_env_with_audit(
         path=args.path,
         env=args.env,
-        audit=True,
         providers=providers,
     )
     
-    # Handle tuple return
-    if isinstance(result, tuple):
-        config, audit = result
-    else:
-        # Should not happen if audit=True, but handle gracefully
-        print("Error: Audit not available", file=sys.stderr)
-        sys.exit(1)
-    
     if args.json:
         print(audit.to_json())
     else:
-        print("=== Configuration Audit ===")
-        print()
+        # Collect the report and write it in one call
+        out = ["=== Configuration Audit ===", ""]
+        P = out.append
         summary = audit.get_summary()
-        print(f"Total variables: {summary['total_variables']}")
-        print(f"Masked variables: {summary['masked_variables']}")
-        print()
-        print("Sources:")
+        P(f"Total variables: {summary['total_variables']}")
+        P(f"Masked variables: {summary['masked_variables']}")
+        P("")
+        P("Sources:")
         for source, count in sorted(summary['sources'].items()):
-            print(f"  {source:20} : {count} variables")
+            P(f"  {source:20} : {count} variables")
         if summary['providers']:
-            print()
-            print("Providers:")
+            P("")
+            P("Providers:")
             for provider, count in sorted(summary['providers'].items()):
-                print(f"  {provider:20} : {count} variables")
-        print()
-        print("Detailed entries:")
+                P(f"  {provider:20} : {count} variables")
+        P("")
+        P("Detailed entries:")
         for key, entry in sorted(audit.entries.items()):
             provider_str = f" ({entry.provider})" if entry.provider else ""
             masked_str = " [MASKED]" if entry.masked else ""
-            print(f"  {key:30} : {entry.source}{provider_str}{masked_str}")
+            P(f"  {key:30} : {entry.source}{provider_str}{masked_str}")
+        sys.stdout.write("\n".join(out) + "\n")
 
 def cmd_explain(args):
     """Explain configuration precedence and policies."""
-    from .core.policy import create_default_policies
-    from .settings import SOURCE_PRIORITY
+    env = args.env or 'ENV'
+    policies = _default_policies()
     
     if args.format == "json":
         output = {
             "precedence": [
-                {"priority": 1, "source": "cloud_providers", "description": "Azure Key Vault, AWS Secrets Manager"},
-                {"priority": 2, "source": "system", "description": "System environment variables"},
-                {"priority": 3, "source": "docker_k8s", "description": "Docker/K8s mounted secrets"},
-                {"priority": 4, "source": "env_specific", "description": f".env.{args.env or 'ENV'} file"},
-                {"priority": 5, "source": "base_file", "description": "Base .env file"},
-                {"priority": 6, "source": "schema_defaults", "description": "Schema default values"},
+                {"priority": priority, "source": source, "description": description.format(env=env)}
+                for priority, source, description, _ in _PRECEDENCE
             ],
-            "failure_policies": create_default_policies(),
+            "failure_policies": dict(policies),
         }
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
     else:
-        print("=" * 70)
-        print("CONFIGURATION PRECEDENCE & POLICIES")
-        print("=" * 70)
-        print()
-        print("Resolution Order (highest to lowest priority):")
-        print()
-        
-        precedence = [
-            (1, "cloud_providers", "Cloud providers (Azure Key Vault, AWS Secrets Manager)"),
-            (2, "system", "System environment variables"),
-            (3, "docker_k8s", "Docker/K8s mounted secrets"),
-            (4, "env_specific", f".env.{args.env or 'ENV'} (environment-specific file)"),
-            (5, "base_file", "Base .env file"),
-            (6, "schema_defaults", "Schema default values"),
+        # Collect the report and write it in one call
+        out = [
+            "=" * 70,
+            "CONFIGURATION PRECEDENCE & POLICIES",
+            "=" * 70,
+            "",
+            "Resolution Order (highest to lowest priority):",
+            "",
         ]
+        P = out.append
         
-        for priority, source, description in precedence:
-            print(f"  {priority}. {description}")
-            print(f"     Source: {source}")
-            print()
+        for priority, source, _, description in _PRECEDENCE:
+            P(f"  {priority}. {description.format(env=env)}")
+            P(f"     Source: {source}")
+            P("")
         
-        print("Failure Policies (default):")
-        print()
-        policies = create_default_policies()
+        P("Failure Policies (default):")
+        P("")
         for provider, policy in sorted(policies.items()):
-            policy_desc = {
-                "fail": "Raise error on failure",
-                "warn": "Log warning and continue",
-                "fallback": "Silently continue (use fallback)",
-            }.get(policy, policy)
-            print(f"  {provider:20} : {policy:10} ({policy_desc})")
-        print()
-        print("Note: Later sources override earlier ones in case of conflicts.")
-        print("      Cloud providers have highest priority (secrets win).")
+            policy_desc = _POLICY_DESCRIPTIONS.get(policy, policy)
+            P(f"  {provider:20} : {policy:10} ({policy_desc})")
+        P("")
+        P("Note: Later sources override earlier ones in case of conflicts.")
+        P("      Cloud providers have highest priority (secrets win).")
+        sys.stdout.write("\n".join(out) + "\n")
 
 def cmd_diff(args):
     """Compare configuration changes."""
@@ -368,27 +420,37 @@ def cmd_diff(args):
     providers = [] if args.ci else None
     
     try:
-        current = load_env(
-            path=args.path,
-            env=args.env,
-            providers=providers,
-        )
-        
-        # Handle tuple return
-        if isinstance(current, tuple):
-            current, _ = current
-        
-        if args.baseline:
-            # Load baseline for comparison
-            baseline = load_env(
-                path=args.baseline,
+        if not args.baseline:
+            current = load_env(
+                path=args.path,
+                env=args.env,
                 providers=providers,
             )
-            if isinstance(baseline, tuple):
-                baseline, _ = baseline
-        else:
-            # No baseline - just show current
+            
+            # No baseline: every key is an addition, no diff needed
+            if not args.deny_secret_changes:
+                if not current:
+                    print("✓ No changes detected")
+                    sys.exit(0)
+                lines = ["Configuration Changes:", "", "Added variables:"]
+                lines.extend(f"  + {key}" for key in sorted(current))
+                print("\n".join(lines))
+                print()
+                sys.exit(0)
             baseline = {}
+        else:
+            # Load current and baseline concurrently to overlap file I/O
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                current_future = executor.submit(
+                    load_env, path=args.path, env=args.env, providers=providers
+                )
+                baseline_future = executor.submit(
+                    load_env, path=args.baseline, providers=providers
+                )
+                current = current_future.result()
+                baseline = baseline_future.result()
         
         # Compute diff
         diff = diff_configs(current, baseline)
@@ -464,6 +526,20 @@ def cmd_decrypt(args):
         print(f"✗ Decryption failed: {e}", file=sys.stderr)
         sys.exit(1)
 
+# Subcommand name -> handler
+_DISPATCH = {
+    "show": cmd_show,
+    "export": cmd_export,
+    "validate": cmd_validate,
+    "generate-example": cmd_generate_example,
+    "dashboard": cmd_dashboard,
+    "audit": cmd_audit,
+    "explain": cmd_explain,
+    "diff": cmd_diff,
+    "encrypt": cmd_encrypt,
+    "decrypt": cmd_decrypt,
+}
+
 if __name__ == "__main__":
     main()
 
@@ -1,14 +1,24 @@
 """Audit metadata tracking for configuration provenance."""
 
 import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Dict, Optional
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
 from ..core.tracing import Origin
 
+# C string encoder used by the stdlib json module
+_encode_str = json.encoder.encode_basestring_ascii
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AuditEntry:
     """Single audit entry for a configuration variable."""
     
@@ -16,12 +26,37 @@ class AuditEntry:
     source: str  # Origin value (azure, aws, system, file, etc.)
     provider: Optional[str] = None  # Provider name if from provider
     masked: bool = True  # Whether value is masked in logs
-    timestamp: datetime = None  # When variable was loaded
+    timestamp: Union[float, datetime, None] = None  # When loaded (epoch seconds or datetime)
+    # (timestamp, ISO string) for the last formatted timestamp
+    _iso: Optional[Tuple[Union[float, datetime], str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Set default timestamp if not provided."""
+        """Intern source/provider names and set default timestamp if not provided."""
+        # Few distinct values shared by many entries; only exact str can be interned
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+        if type(self.provider) is str:
+            self.provider = sys.intern(self.provider)
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            self.timestamp = time.time()
+    
+    @property
+    def timestamp_dt(self) -> Optional[datetime]:
+        """Timestamp as a naive UTC datetime."""
+        ts = self.timestamp
+        if ts is None or isinstance(ts, datetime):
+            return ts
+        return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+    
+    def timestamp_iso(self) -> Optional[str]:
+        """ISO-formatted timestamp, formatted once per timestamp value."""
+        ts = self.timestamp
+        if ts is None:
+            return None
+        cached = self._iso
+        if cached is None or cached[0] is not ts:
+            cached = self._iso = (ts, self.timestamp_dt.isoformat())
+        return cached[1]
     
     def to_dict(self) -> Dict:
         """Convert to dictionary (safe for JSON serialization)."""
@@ -30,16 +65,64 @@ class AuditEntry:
             "source": self.source,
             "provider": self.provider,
             "masked": self.masked,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "timestamp": self.timestamp_iso(),
         }
 
 
+def _encode_optional(value: Optional[str]) -> str:
+    return "null" if value is None else _encode_str(value)
+
+
+def _encode_entry(entry: AuditEntry, inner: str, outer: str) -> str:
+    """Encode an entry as indented JSON without building a dict first.
+    
+    Produces the same text as ``json.dumps(entry.to_dict(), indent=...)``
+    nested one level deep.
+    """
+    timestamp = entry.timestamp_iso()
+    return (
+        "{" + inner + '"key": ' + _encode_str(entry.key)
+        + "," + inner + '"source": ' + _encode_str(entry.source)
+        + "," + inner + '"provider": ' + _encode_optional(entry.provider)
+        + "," + inner + '"masked": ' + ("true" if entry.masked else "false")
+        + "," + inner + '"timestamp": ' + _encode_optional(timestamp)
+        + outer + "}"
+    )
+
+
 class ConfigAudit:
-    """Audit trail for configuration loading."""
+    """Audit trail for configuration loading.
+    
+    Additions are buffered as plain tuples and turned into
+    :class:`AuditEntry` objects the first time ``entries`` is read.
+    """
+    
+    __slots__ = ("_entries", "_pending")
     
     def __init__(self):
         """Initialize empty audit."""
-        self.entries: Dict[str, AuditEntry] = {}
+        self._entries: Dict[str, AuditEntry] = {}
+        # (key, source, provider, masked, timestamp) not yet in _entries
+        self._pending: List[Tuple[str, str, Optional[str], bool, Union[float, datetime]]] = []
+    
+    @property
+    def entries(self) -> Dict[str, AuditEntry]:
+        """Audit entries keyed by variable name."""
+        if self._pending:
+            self._flush()
+        return self._entries
+    
+    @entries.setter
+    def entries(self, value: Dict[str, AuditEntry]) -> None:
+        self._pending.clear()
+        self._entries = value
+    
+    def _flush(self) -> None:
+        """Build entries for all buffered additions, in insertion order."""
+        entries = self._entries
+        for key, source, provider, masked, timestamp in self._pending:
+            entries[key] = AuditEntry(key, source, provider, masked, timestamp)
+        self._pending.clear()
     
     def add(
         self,
@@ -47,7 +130,7 @@ class ConfigAudit:
         source: str,
         provider: Optional[str] = None,
         masked: bool = True,
-        timestamp: Optional[datetime] = None,
+        timestamp: Union[float, datetime, None] = None,
     ) -> None:
         """Add an audit entry.
         
@@ -56,16 +139,36 @@ class ConfigAudit:
             source: Source origin (azure, aws, system, file, etc.)
             provider: Optional provider name
             masked: Whether value is masked
-            timestamp: Optional timestamp (defaults to now)
+            timestamp: Optional epoch seconds or datetime (defaults to now)
         """
-        entry = AuditEntry(
-            key=key,
-            source=source,
-            provider=provider,
-            masked=masked,
-            timestamp=timestamp or datetime.utcnow(),
-        )
-        self.entries[key] = entry
+        if timestamp is None:
+            timestamp = time.time()
+        self._pending.append((key, source, provider, masked, timestamp))
+    
+    def add_many(
+        self,
+        keys: Iterable[str],
+        source: str,
+        provider: Optional[str] = None,
+        masked: Union[bool, Callable[[str], bool]] = True,
+    ) -> None:
+        """Add entries for several keys from the same source.
+        
+        Args:
+            keys: Variable key names
+            source: Source origin (azure, aws, system, file, etc.)
+            provider: Optional provider name
+            masked: Whether values are masked, or a function deciding per key
+        """
+        now = time.time()
+        if callable(masked):
+            self._pending.extend(
+                (key, source, provider, masked(key), now) for key in keys
+            )
+        else:
+            self._pending.extend(
+                (key, source, provider, masked, now) for key in keys
+            )
     
     def get(self, key: str) -> Optional[AuditEntry]:
         """Get audit entry for a key.
@@ -95,7 +198,38 @@ class ConfigAudit:
         Returns:
             JSON string
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        if indent is None or not self.entries:
+            return json.dumps(self.to_dict(), indent=indent)
+        
+        outer = "\n" + " " * indent
+        inner = outer + " " * indent
+        return "{" + ",".join(
+            outer + _encode_str(key) + ": " + _encode_entry(entry, inner, outer)
+            for key, entry in self.entries.items()
+        ) + "\n}"
+    
+    def write_json(self, fp: TextIO, indent: int = 2) -> None:
+        """Write the audit as JSON to a text file, one entry at a time.
+        
+        Produces the same document as :meth:`to_json` without building
+        the whole string in memory.
+        
+        Args:
+            fp: Writable text file object
+            indent: JSON indentation
+        """
+        if indent is None or not self.entries:
+            json.dump(self.to_dict(), fp, indent=indent)
+            return
+        
+        outer = "\n" + " " * indent
+        inner = outer + " " * indent
+        write = fp.write
+        sep = "{"
+        for key, entry in self.entries.items():
+            write(sep + outer + _encode_str(key) + ": " + _encode_entry(entry, inner, outer))
+            sep = ","
+        write("\n}")
     
     def get_by_source(self, source: str) -> Dict[str, AuditEntry]:
         """Get all entries from a specific source.
@@ -114,22 +248,17 @@ class ConfigAudit:
         Returns:
             Dictionary with summary stats
         """
-        sources = {}
-        providers = {}
-        masked_count = 0
-        
-        for entry in self.entries.values():
-            sources[entry.source] = sources.get(entry.source, 0) + 1
-            if entry.provider:
-                providers[entry.provider] = providers.get(entry.provider, 0) + 1
-            if entry.masked:
-                masked_count += 1
+        # Column-wise passes: each map/Counter runs in C
+        entries = self.entries.values()
+        sources = Counter(map(attrgetter("source"), entries))
+        providers = Counter(filter(None, map(attrgetter("provider"), entries)))
+        masked_count = sum(map(attrgetter("masked"), entries))
         
         return {
             "total_variables": len(self.entries),
             "masked_variables": masked_count,
-            "sources": sources,
-            "providers": providers,
+            "sources": dict(sources),
+            "providers": dict(providers),
         }
     
     def merge(self, other: "ConfigAudit") -> "ConfigAudit":
@@ -142,5 +271,6 @@ class ConfigAudit:
             New ConfigAudit with merged entries
         """
         merged = ConfigAudit()
-        merged.entries = {**self.entries, **other.entries}
+        merged.entries = self.entries.copy()
+        merged.entries.update(other.entries)
         return merged
@@ -1,12 +1,23 @@
 """TTL-based caching for configuration values."""
 
+import heapq
+import os
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Parsed .env files keyed by (absolute path, mtime_ns, size)
+_PARSE_CACHE_MAXSIZE = 64
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, str]]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
 
 
 class Cache:
     """TTL-based cache for configuration values."""
     
+    __slots__ = ("ttl", "enabled", "_entries", "_heap")
+    
     def __init__(self, ttl: int = 3600, enabled: bool = True):
         """Initialize cache.
         
@@ -16,8 +27,10 @@ class Cache:
         """
         self.ttl = ttl
         self.enabled = enabled
-        self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, float] = {}
+        # key -> (monotonic expiry time, value)
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        # (expiry, key) min-heap for lazy eviction; may hold stale pairs
+        self._heap: List[Tuple[float, str]] = []
     
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache if valid.
@@ -31,16 +44,17 @@ class Cache:
         if not self.enabled:
             return None
         
-        if key not in self._cache:
+        entry = self._entries.get(key)
+        if entry is None:
             return None
         
-        if not self._is_valid(key):
+        expiry, value = entry
+        if expiry <= time.monotonic():
             # Remove expired entry
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
+            del self._entries[key]
             return None
         
-        return self._cache[key]
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """Set a value in cache.
@@ -52,23 +66,74 @@ class Cache:
         if not self.enabled:
             return
         
-        self._cache[key] = value
-        self._timestamps[key] = time.time()
+        now = time.monotonic()
+        expiry = now + self.ttl
+        self._entries[key] = (expiry, value)
+        heapq.heappush(self._heap, (expiry, key))
+        self._sweep(now)
     
-    def _is_valid(self, key: str) -> bool:
-        """Check if a cached value is still valid.
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values from cache.
         
         Args:
-            key: Cache key
+            keys: Cache keys
         
         Returns:
-            True if value is still valid
+            Dictionary of the keys that were found and still valid
         """
-        if key not in self._timestamps:
-            return False
+        if not self.enabled:
+            return {}
         
-        elapsed = time.time() - self._timestamps[key]
-        return elapsed < self.ttl
+        entries = self._entries
+        now = time.monotonic()
+        found: Dict[str, Any] = {}
+        for key in keys:
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            if entry[0] <= now:
+                del entries[key]
+            else:
+                found[key] = entry[1]
+        return found
+    
+    def set_many(self, mapping: Mapping[str, Any]) -> None:
+        """Set several values in cache with a shared expiry.
+        
+        Args:
+            mapping: Cache keys mapped to values
+        """
+        if not self.enabled or not mapping:
+            return
+        
+        now = time.monotonic()
+        expiry = now + self.ttl
+        heap = self._heap
+        for key, value in mapping.items():
+            self._entries[key] = (expiry, value)
+            heapq.heappush(heap, (expiry, key))
+        self._sweep(now)
+    
+    def _sweep(self, now: float) -> None:
+        """Evict entries whose expiry has passed.
+        
+        Heap pairs left behind by overwritten keys are skipped, and the heap
+        is rebuilt when they outnumber live entries.
+        
+        Args:
+            now: Current ``time.monotonic()`` value
+        """
+        heap = self._heap
+        entries = self._entries
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = entries.get(key)
+            if entry is not None and entry[0] == expiry:
+                del entries[key]
+        
+        if len(heap) > 2 * len(entries) + 32:
+            self._heap = [(expiry, key) for key, (expiry, _) in entries.items()]
+            heapq.heapify(self._heap)
     
     def invalidate(self, key: Optional[str] = None) -> None:
         """Invalidate cache entry(ies).
@@ -77,11 +142,10 @@ class Cache:
             key: Specific key to invalidate, or None to clear all
         """
         if key is None:
-            self._cache.clear()
-            self._timestamps.clear()
+            self._entries.clear()
+            self._heap.clear()
         else:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
+            self._entries.pop(key, None)
     
     def clear(self) -> None:
         """Clear all cache entries."""
@@ -93,13 +157,54 @@ class Cache:
         Returns:
             Dictionary with cache stats
         """
-        valid_count = sum(1 for k in self._cache.keys() if self._is_valid(k))
-        expired_count = len(self._cache) - valid_count
+        # Expired entries are evicted first, so everything left is valid
+        self._sweep(time.monotonic())
         
         return {
             "enabled": self.enabled,
             "ttl": self.ttl,
-            "total_entries": len(self._cache),
-            "valid_entries": valid_count,
-            "expired_entries": expired_count,
+            "total_entries": len(self._entries),
+            "valid_entries": len(self._entries),
+            "expired_entries": 0,
         }
+
+
+def parsed_env(
+    path: str,
+    parse: Callable[[str], Dict[str, str]],
+    stat: Optional[os.stat_result] = None,
+) -> Dict[str, str]:
+    """Parse a file once per (path, mtime, size) and reuse the result.
+    
+    The returned dictionary is shared between callers and must not be
+    mutated. Entries are invalidated automatically when the file changes.
+    
+    Args:
+        path: Path to the file
+        parse: Function that parses the file into a dictionary
+        stat: Existing stat result for ``path`` (avoids a second stat)
+    
+    Returns:
+        Parsed key/value dictionary
+    """
+    st = stat if stat is not None else os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    
+    with _PARSE_CACHE_LOCK:
+        hit = _PARSE_CACHE.get(key)
+        if hit is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return hit
+    
+    data = parse(path)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = data
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return data
+
+
+def clear_parse_cache() -> None:
+    """Clear all cached parsed files."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
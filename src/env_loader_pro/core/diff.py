@@ -1,13 +1,17 @@
 """Configuration diff and drift detection."""
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from ..utils.masking import is_secret_key
 
+_MISSING = object()
+
 
 class ConfigDiff:
     """Tracks differences between configurations."""
     
+    __slots__ = ("added", "removed", "changed", "current", "baseline", "_secret_keys", "_sorted")
+    
     def __init__(
         self,
         added: Set[str],
@@ -30,6 +34,10 @@ class ConfigDiff:
         self.changed = changed
         self.current = current
         self.baseline = baseline
+        # (added secrets, removed secrets), classified on first use
+        self._secret_keys: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None
+        # Sorted (added, removed, changed), built by the first to_dict()
+        self._sorted: Optional[Tuple[List[str], List[str], List[str]]] = None
     
     def has_changes(self) -> bool:
         """Check if there are any changes.
@@ -45,22 +53,31 @@ class ConfigDiff:
         Returns:
             Dictionary with 'added' and 'removed' secret keys
         """
-        return {
-            "added": {k for k in self.added if is_secret_key(k)},
-            "removed": {k for k in self.removed if is_secret_key(k)},
-        }
+        if self._secret_keys is None:
+            self._secret_keys = (
+                frozenset(filter(is_secret_key, self.added)),
+                frozenset(filter(is_secret_key, self.removed)),
+            )
+        added, removed = self._secret_keys
+        return {"added": set(added), "removed": set(removed)}
     
     def to_dict(self) -> Dict:
         """Convert diff to dictionary.
         
+        The key lists are sorted once; the diff sets are not expected to
+        change after construction.
+        
         Returns:
             Dictionary representation
         """
+        if self._sorted is None:
+            self._sorted = (sorted(self.added), sorted(self.removed), sorted(self.changed))
+        added, removed, changed = self._sorted
         return {
-            "added": sorted(self.added),
-            "removed": sorted(self.removed),
-            "changed": sorted(self.changed),
-            "has_changes": self.has_changes(),
+            "added": list(added),
+            "removed": list(removed),
+            "changed": list(changed),
+            "has_changes": bool(added or removed or changed),
         }
     
     def validate_no_secret_changes(self) -> None:
@@ -69,6 +86,12 @@ class ConfigDiff:
         Raises:
             ValueError: If secrets were added or removed
         """
+        # Common case: no secret keys touched, stop at the first hit otherwise
+        if self._secret_keys is None and not (
+            any(map(is_secret_key, self.added)) or any(map(is_secret_key, self.removed))
+        ):
+            return
+        
         secret_changes = self.get_secret_changes()
         if secret_changes["added"] or secret_changes["removed"]:
             msg_parts = []
@@ -92,15 +115,23 @@ def diff_configs(
     Returns:
         ConfigDiff instance
     """
-    current_keys = set(current.keys())
-    baseline_keys = set(baseline.keys())
+    if current is baseline:
+        return ConfigDiff(added=set(), removed=set(), changed=set(), current=current, baseline=baseline)
+    
+    # Key views support set arithmetic without copying the keys first
+    if len(current) == len(baseline) and current.keys() == baseline.keys():
+        added, removed = set(), set()
+    else:
+        added = current.keys() - baseline.keys()
+        removed = baseline.keys() - current.keys()
     
-    added = current_keys - baseline_keys
-    removed = baseline_keys - current_keys
-    changed = {
-        k for k in current_keys & baseline_keys
-        if current[k] != baseline[k]
-    }
+    # One pass over current, one baseline lookup per key
+    baseline_get = baseline.get
+    changed = set()
+    for k, v in current.items():
+        b = baseline_get(k, _MISSING)
+        if b is not _MISSING and b != v:
+            changed.add(k)
     
     return ConfigDiff(
         added=added,
@@ -1,42 +1,190 @@
-"""Core loader with unified API for enterprise-grade configuration loading."""
+"""Core loader with unified API for enterprise-grade configuration loading.
+
+Each .env file is stat'ed once per load; the resulting ``_LoadContext``
+(absolute path plus ``os.stat_result``) is reused by the parse cache
+instead of re-checking existence and metadata.
+"""
 
 import json
+import mmap
 import os
 import re
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Type, Union
 
 from .audit import ConfigAudit
-from .cache import Cache
+from .cache import Cache, parsed_env
 from .merger import ConfigurationMerger
 from .policy import PolicyManager, ProviderResult, create_default_policies
 from .policy_code import Policy, load_policy
 from .schema import SchemaValidator, extract_schema_info
 from .tracing import Origin, Tracer
-from ..crypto import get_decryptor_registry
 from ..exceptions import EnvLoaderError, ValidationError
-from ..providers.base import BaseProvider
 from ..settings import DEFAULT_ENV_FILE
 from ..utils.masking import is_secret_key, mask_value
+from ..utils.serialization import dumps_json
+
+if TYPE_CHECKING:
+    from ..providers.base import BaseProvider
+
+# Regex validators are usually the same patterns on every load
+_compile_regex = lru_cache(maxsize=512)(re.compile)
+
+# Files at least this large are parsed through mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# ${VAR} references inside values
+_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# KEY=VALUE lines; surrounding whitespace is excluded from both groups and
+# lines that are blank, comments or have no '=' do not match
+_DOTENV_LINE = re.compile(
+    r"^[^\S\n]*(?P<key>(?:[^\s#=](?:[^=\n]*[^\s=])?)?)[^\S\n]*="
+    r"[^\S\n]*(?P<value>(?:[^\n]*\S)?)[^\S\n]*$",
+    re.MULTILINE,
+)
 
+# Line boundaries recognised by str.splitlines() other than "\n"
+_LINE_BREAKS = re.compile("\r\n?|[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@dataclass
+class _LoadContext:
+    """Resolved path and metadata for a single .env file."""
+    abspath: str
+    stat: os.stat_result
+
+
+def _prepare(path: str) -> Optional[_LoadContext]:
+    """Stat a file once, returning None if it does not exist."""
+    abspath = os.path.abspath(path)
+    try:
+        return _LoadContext(abspath, os.stat(abspath))
+    except FileNotFoundError:
+        return None
 
-def _expand_variables(value: str, env_dict: Dict[str, str], visited: Optional[set] = None) -> str:
-    """Expand ${VAR} syntax with cycle detection."""
-    if visited is None:
-        visited = set()
+
+def _expand_all(env: Mapping[str, str], inplace: bool = False) -> Dict[str, str]:
+    """Expand ${VAR} references across a whole mapping.
+    
+    Each value is tokenized once, variables are substituted in dependency
+    order (Kahn's algorithm), and unknown references are left as-is.
+    
+    Args:
+        env: Mapping to expand
+        inplace: Update ``env`` (a dict) directly instead of copying it
+    
+    Raises:
+        EnvLoaderError: If variables reference each other in a cycle
+    """
+    # key -> referenced keys that exist in env
+    refs: Dict[str, set] = {}
+    for key, value in env.items():
+        if isinstance(value, str) and '${' in value:
+            names = {name for name in _VAR_PATTERN.findall(value) if name in env}
+            if names:
+                refs[key] = names
+    
+    resolved = env if inplace else dict(env)
+    if not refs:
+        return resolved
+    
+    dependents: Dict[str, List[str]] = {}
+    pending: Dict[str, int] = {}
+    ready = []
+    for key, names in refs.items():
+        count = 0
+        for name in names:
+            if name in refs:
+                dependents.setdefault(name, []).append(key)
+                count += 1
+        if count:
+            pending[key] = count
+        else:
+            ready.append(key)
     
     def replace_var(match):
-        var_name = match.group(1)
-        if var_name in visited:
-            raise EnvLoaderError(f"Circular reference detected for variable: {var_name}")
-        if var_name not in env_dict:
-            return match.group(0)  # Return original if not found
-        visited.add(var_name)
-        result = _expand_variables(env_dict[var_name], env_dict, visited)
-        visited.remove(var_name)
-        return result
+        return resolved.get(match.group(1), match.group(0))
+    
+    while ready:
+        key = ready.pop()
+        resolved[key] = _VAR_PATTERN.sub(replace_var, env[key])
+        for dependent in dependents.get(key, ()):
+            pending[dependent] -= 1
+            if not pending[dependent]:
+                del pending[dependent]
+                ready.append(dependent)
+    
+    if pending:
+        cycle = _find_cycle(pending, refs)
+        raise EnvLoaderError(
+            f"Circular reference detected for variable: {cycle[0]} "
+            f"({' -> '.join(cycle)})"
+        )
+    return resolved
+
+
+def _find_cycle(pending: Mapping[str, int], refs: Mapping[str, set]) -> List[str]:
+    """Return one reference cycle among variables left unresolved.
     
-    pattern = r'\$\{([^}]+)\}'
-    return re.sub(pattern, replace_var, value)
+    Every unresolved variable references at least one other unresolved
+    variable, so following those references must revisit a variable.
+    The returned path starts and ends with the same cycle member.
+    """
+    path: List[str] = []
+    position: Dict[str, int] = {}
+    key = min(pending)
+    while key not in position:
+        position[key] = len(path)
+        path.append(key)
+        key = min(name for name in refs[key] if name in pending)
+    return path[position[key]:] + [key]
+
+
+_TRUE_VALUES = frozenset(("1", "true", "yes", "y", "t"))
+_FALSE_VALUES = frozenset(("0", "false", "no", "n", "f"))
+
+
+def _to_bool(value: str) -> bool:
+    val = value.strip().lower()
+    if val in _TRUE_VALUES:
+        return True
+    if val in _FALSE_VALUES:
+        return False
+    raise EnvLoaderError(f"Cannot cast '{value}' to bool")
+
+
+def _to_list(value: str) -> list:
+    # Try JSON first
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    # Fall back to comma-separated
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _to_dict(value: str) -> dict:
+    try:
+        result = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise EnvLoaderError(f"Cannot cast '{value}' to dict: {e}")
+    if not isinstance(result, dict):
+        raise EnvLoaderError(f"Cannot cast '{value}' to dict: not a JSON object")
+    return result
+
+
+# Casters for types that need more than ``to_type(value)``
+_CASTERS: Dict[Any, Callable[[str], Any]] = {
+    bool: _to_bool,
+    list: _to_list,
+    dict: _to_dict,
+}
 
 
 def _cast_value(value: str, to_type: Optional[Callable]) -> Any:
@@ -44,82 +192,192 @@ def _cast_value(value: str, to_type: Optional[Callable]) -> Any:
     if to_type is None:
         return value
     
-    if to_type is bool:
-        val = value.strip().lower()
-        if val in ["1", "true", "yes", "y", "t"]:
-            return True
-        if val in ["0", "false", "no", "n", "f"]:
-            return False
-        raise EnvLoaderError(f"Cannot cast '{value}' to bool")
-    
-    # Handle list types
     try:
-        if to_type == list or (isinstance(to_type, type) and to_type == list):
-            # Try JSON first
-            value = value.strip()
-            if value.startswith('[') and value.endswith(']'):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    pass
-            # Fall back to comma-separated
-            return [item.strip() for item in value.split(',') if item.strip()]
-    except (TypeError, AttributeError):
-        pass
+        caster = _CASTERS.get(to_type, to_type)
+    except TypeError:  # unhashable callable
+        caster = to_type
     
     try:
-        return to_type(value)
+        return caster(value)
+    except EnvLoaderError:
+        raise
     except Exception as e:
         raise EnvLoaderError(f"Failed to cast env value '{value}' to {to_type}: {e}")
 
 
+def _parse_content(content: str) -> Dict[str, str]:
+    """Parse .env content into a raw key/value dictionary.
+    
+    Lines are split like ``str.splitlines()``, keys and values are
+    whitespace-stripped, and any double quotes and then single quotes
+    are stripped from both ends of a value.
+    """
+    content = _LINE_BREAKS.sub("\n", content)
+    # Build the dict in C, then fix up only the quoted values
+    out: Dict[str, str] = dict(_DOTENV_LINE.findall(content))
+    for key, value in out.items():
+        if value and (value[0] in "\"'" or value[-1] in "\"'"):
+            out[key] = value.strip('"').strip("'")
+    return out
+
+
+def _read_dotenv(path: str, size: Optional[int] = None) -> Dict[str, str]:
+    """Read and parse a plaintext .env file.
+    
+    The file is read unbuffered in a single call. Files of
+    ``_MMAP_THRESHOLD`` bytes or more are memory-mapped and decoded
+    straight from the mapping, skipping the intermediate bytes copy.
+    """
+    with open(path, "rb", buffering=0) as fh:
+        if size is None:
+            size = os.fstat(fh.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return _parse_content(fh.read().decode("utf-8"))
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _parse_content(str(buf, "utf-8"))
+
+
 def _parse_dotenv(
     path: str,
     expand_vars: bool = True,
     encrypted: bool = False,
-    encryption_key: Optional[str] = None
+    encryption_key: Optional[str] = None,
+    cache: bool = True,
+    ctx: Optional[_LoadContext] = None,
 ) -> Dict[str, str]:
-    """Parse .env file with optional encryption support."""
-    out: Dict[str, str] = {}
-    if not os.path.exists(path):
-        return out
+    """Parse .env file with optional encryption support.
+    
+    Plaintext files are parsed once per (path, mtime, size) when ``cache``
+    is enabled; encrypted files are always decrypted fresh. ``ctx`` may be
+    passed to reuse an existing stat of ``path``.
+    """
+    if ctx is None:
+        ctx = _prepare(path)
+        if ctx is None:
+            return {}
     
     # Handle encrypted files
-    content = None
     if encrypted:
+        from ..crypto import get_decryptor_registry
+        
         try:
             registry = get_decryptor_registry()
             content = registry.decrypt(path, encryption_key)
         except Exception as e:
             raise EnvLoaderError(f"Failed to decrypt file {path}: {e}")
-    
-    if content is None:
-        with open(path, "r", encoding="utf-8") as fh:
-            content = fh.read()
-    
-    # Parse content
-    for raw in content.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, val = line.split("=", 1)
-        key = key.strip()
-        val = val.strip().strip('"').strip("'")
-        out[key] = val
+        out = _parse_content(content)
+    elif cache:
+        # Shared cache entry - never mutated below
+        out = parsed_env(ctx.abspath, _read_dotenv, stat=ctx.stat)
+    else:
+        out = _read_dotenv(ctx.abspath, ctx.stat.st_size)
     
     # Expand variables if requested
     if expand_vars:
-        expanded = {}
-        for k, v in out.items():
-            expanded[k] = _expand_variables(v, out)
-        return expanded
-    return out
+        return _expand_all(out)
+    return dict(out)
+
+
+def _dump_yaml(data: Dict[str, Any]) -> bytes:
+    try:
+        import yaml
+    except ImportError:
+        raise EnvLoaderError("PyYAML required for YAML export. Install: pip install pyyaml")
+    return yaml.dump(data, default_flow_style=False, encoding="utf-8")
+
+
+# Serializers used by ConfigDict.save(), keyed by format name
+_WRITERS: Dict[str, Callable[[Dict[str, Any]], bytes]] = {
+    "json": dumps_json,
+    "yaml": _dump_yaml,
+}
+
+
+# Provider class-name fragment -> origin, checked in order
+_ORIGIN_MAP = (
+    ("Azure", Origin.CLOUD_AZURE),
+    ("AWS", Origin.CLOUD_AWS),
+    ("Docker", Origin.DOCKER),
+    ("Kubernetes", Origin.K8S),
+)
+
+
+@lru_cache(maxsize=256)
+def _provider_origin(provider_name: str) -> Origin:
+    """Determine the origin of a provider from its class name."""
+    return next(
+        (origin for fragment, origin in _ORIGIN_MAP if fragment in provider_name),
+        Origin.UNKNOWN,
+    )
+
+
+# Upper bound on concurrent provider fetches
+_PROVIDER_WORKERS = 8
+
+
+# Mounted-secret providers (Docker, Kubernetes), created on first use
+_MOUNTED_PROVIDERS: Optional[Tuple["BaseProvider", "BaseProvider"]] = None
+# (time.monotonic() of last check, docker available, k8s available)
+_MOUNTED_AVAILABLE: Optional[Tuple[float, bool, bool]] = None
+# Seconds before mount availability is checked again
+_MOUNT_CHECK_TTL = 30.0
+
+
+def _mounted_providers(recheck: bool = False) -> List[Tuple["BaseProvider", Origin]]:
+    """Return the Docker/K8s secret providers whose mounts are present.
+    
+    Provider instances are shared across loads, and availability is
+    re-checked at most every ``_MOUNT_CHECK_TTL`` seconds.
+    
+    Args:
+        recheck: Check availability now regardless of the TTL
+    
+    Raises:
+        ImportError: If the provider module cannot be imported
+    """
+    global _MOUNTED_PROVIDERS, _MOUNTED_AVAILABLE
+    if _MOUNTED_PROVIDERS is None:
+        from ..providers.docker import DockerSecretsProvider, KubernetesSecretsProvider
+        _MOUNTED_PROVIDERS = (DockerSecretsProvider(), KubernetesSecretsProvider())
+    docker_provider, k8s_provider = _MOUNTED_PROVIDERS
+    
+    now = time.monotonic()
+    checked = _MOUNTED_AVAILABLE
+    if recheck or checked is None or now - checked[0] >= _MOUNT_CHECK_TTL:
+        checked = _MOUNTED_AVAILABLE = (
+            now, docker_provider.is_available(), k8s_provider.is_available()
+        )
+    
+    available = []
+    if checked[1]:
+        available.append((docker_provider, Origin.DOCKER))
+    if checked[2]:
+        available.append((k8s_provider, Origin.K8S))
+    return available
+
+
+def _fetch_provider(provider: "BaseProvider") -> Dict[str, str]:
+    """Fetch all values from a provider."""
+    # Try get_all first (most efficient)
+    if hasattr(provider, 'get_all') and callable(provider.get_all):
+        return provider.get_all()
+    # Fall back to get_many with empty list (providers should handle this)
+    return provider.get_many([])
+
+
+def _fetch_providers(providers: List["BaseProvider"]) -> List["Future[Dict[str, str]]"]:
+    """Fetch providers concurrently, returning futures in provider order.
+    
+    Provider calls are network-bound, so overlapping them bounds the wall
+    time by the slowest provider rather than the sum of all of them.
+    """
+    workers = min(_PROVIDER_WORKERS, len(providers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [executor.submit(_fetch_provider, provider) for provider in providers]
 
 
 def _load_from_providers(
-    providers: List[BaseProvider],
+    providers: List["BaseProvider"],
     tracer: Optional[Tracer] = None,
     cache: Optional[Cache] = None,
     policy_manager: Optional[PolicyManager] = None,
@@ -140,53 +398,47 @@ def _load_from_providers(
     result = {}
     policy_manager = policy_manager or PolicyManager()
     
-    for provider in providers:
+    # Fetch concurrently, but apply results in provider order so merging
+    # and error policies stay deterministic
+    futures = _fetch_providers(providers) if len(providers) > 1 else None
+    
+    for index, provider in enumerate(providers):
         provider_name = provider.__class__.__name__
         provider_result = None
         
         try:
-            # Try get_all first (most efficient)
-            if hasattr(provider, 'get_all') and callable(provider.get_all):
-                provider_values = provider.get_all()
+            if futures is not None:
+                provider_values = futures[index].result()
             else:
-                # Fall back to get_many with empty list (providers should handle this)
-                provider_values = provider.get_many([])
+                provider_values = _fetch_provider(provider)
             
             # Apply caching if enabled
             if cache and cache.enabled:
+                prefix = f"provider:{provider_name}:"
+                cached = cache.get_many([prefix + key for key in provider_values])
+                missing = {}
                 for key, value in provider_values.items():
-                    cached = cache.get(f"provider:{provider_name}:{key}")
-                    if cached is not None:
-                        provider_values[key] = cached
+                    hit = cached.get(prefix + key)
+                    if hit is not None:
+                        provider_values[key] = hit
                     else:
-                        cache.set(f"provider:{provider_name}:{key}", value)
+                        missing[prefix + key] = value
+                cache.set_many(missing)
             
             provider_result = ProviderResult(data=provider_values)
             result.update(provider_values)
             
             # Record origins and audit
-            if tracer and tracer.enabled:
-                # Determine origin based on provider type
-                if "Azure" in provider_name:
-                    origin = Origin.CLOUD_AZURE
-                elif "AWS" in provider_name:
-                    origin = Origin.CLOUD_AWS
-                elif "Docker" in provider_name:
-                    origin = Origin.DOCKER
-                elif "Kubernetes" in provider_name:
-                    origin = Origin.K8S
-                else:
-                    origin = Origin.UNKNOWN
-                
-                for key in provider_values.keys():
-                    tracer.record(key, origin, {"provider": provider_name})
-                    if audit:
-                        audit.add(
-                            key=key,
-                            source=origin.value,
-                            provider=provider_name,
-                            masked=is_secret_key(key),
-                        )
+            tracing = tracer is not None and tracer.enabled
+            if tracing or audit:
+                origin = _provider_origin(provider_name)
+                if tracing:
+                    tracer.record_many(provider_values.keys(), origin, {"provider": provider_name})
+                if audit:
+                    audit.add_many(
+                        provider_values.keys(), origin.value,
+                        provider=provider_name, masked=is_secret_key,
+                    )
         
         except Exception as e:
             # Handle error according to policy
@@ -200,13 +452,19 @@ def _load_from_providers(
     return result
 
 
+class _LoadResult(NamedTuple):
+    """Loaded configuration and its audit trail."""
+    config: Dict[str, Any]
+    audit: Optional[ConfigAudit]
+
+
 def load_env(
     env: Optional[str] = None,
     path: str = DEFAULT_ENV_FILE,
     strict: bool = False,
     trace: bool = False,
     audit: bool = False,
-    providers: Optional[List[BaseProvider]] = None,
+    providers: Optional[List["BaseProvider"]] = None,
     cache: bool = True,
     cache_ttl: int = 3600,
     watch: bool = False,
@@ -250,7 +508,7 @@ def load_env(
         trace: Enable origin tracking for observability
         audit: Enable audit tracking (returns tuple: (config, audit))
         providers: List of BaseProvider instances (Azure, AWS, etc.)
-        cache: Enable caching for provider values
+        cache: Enable caching for provider values and parsed .env files
         cache_ttl: Cache TTL in seconds
         watch: Enable live reloading (requires watchdog)
         failure_policy: Dictionary mapping provider names to policies (fail/warn/fallback)
@@ -279,6 +537,83 @@ def load_env(
         EnvLoaderError: On configuration errors
         ValidationError: On validation failures
     """
+    result = _load_env_impl(
+        env=env,
+        path=path,
+        strict=strict,
+        trace=trace,
+        audit=audit,
+        providers=providers,
+        cache=cache,
+        cache_ttl=cache_ttl,
+        watch=watch,
+        failure_policy=failure_policy,
+        policy=policy,
+        required=required,
+        optional=optional,
+        types=types,
+        defaults=defaults,
+        priority=priority,
+        mask_secrets=mask_secrets,
+        expand_vars=expand_vars,
+        rules=rules,
+        schema=schema,
+        nested=nested,
+        nested_separator=nested_separator,
+        encrypted=encrypted,
+        encryption_key=encryption_key,
+        regex_validators=regex_validators,
+        deprecated_vars=deprecated_vars,
+    )
+    # Return with audit if requested
+    if audit and result.audit is not None:
+        return result.config, result.audit
+    return result.config
+
+
+def load_env_with_audit(**kwargs: Any) -> _LoadResult:
+    """Load configuration with audit tracking enabled.
+    
+    Accepts the same keyword arguments as :func:`load_env`.
+    
+    Returns:
+        _LoadResult named tuple of (config, audit)
+    """
+    kwargs["audit"] = True
+    return _load_env_impl(**kwargs)
+
+
+def _load_env_impl(
+    env: Optional[str] = None,
+    path: str = DEFAULT_ENV_FILE,
+    strict: bool = False,
+    trace: bool = False,
+    audit: bool = False,
+    providers: Optional[List["BaseProvider"]] = None,
+    cache: bool = True,
+    cache_ttl: int = 3600,
+    watch: bool = False,
+    failure_policy: Optional[Dict[str, str]] = None,
+    policy: Optional[Union[str, Policy]] = None,  # Policy-as-code
+    # Legacy parameters (for backward compatibility)
+    required: Optional[Iterable[str]] = None,
+    optional: Optional[Iterable[str]] = None,
+    types: Optional[Mapping[str, Callable]] = None,
+    defaults: Optional[Mapping[str, Any]] = None,
+    priority: str = "file",  # Legacy, not used in new architecture
+    mask_secrets: bool = True,
+    expand_vars: bool = True,
+    rules: Optional[Mapping[str, Callable[[Any], bool]]] = None,
+    schema: Optional[Union[Type, Any]] = None,
+    nested: bool = False,
+    nested_separator: str = "__",
+    encrypted: bool = False,
+    encryption_key: Optional[str] = None,
+    # Advanced validation
+    regex_validators: Optional[Mapping[str, str]] = None,
+    deprecated_vars: Optional[List[str]] = None,
+) -> _LoadResult:
+    """Load configuration and return it together with the audit (if any)."""
     # Initialize components
     tracer = Tracer(enabled=trace, mask_secrets=mask_secrets)
     cache_obj = Cache(ttl=cache_ttl, enabled=cache)
@@ -324,106 +659,66 @@ def load_env(
     if defaults:
         sources["schema_defaults"] = {k: str(v) for k, v in defaults.items()}
         if tracer.enabled:
-            for key in defaults.keys():
-                tracer.record(key, Origin.SCHEMA_DEFAULT)
+            tracer.record_many(defaults.keys(), Origin.SCHEMA_DEFAULT)
         if audit_obj:
-            for key in defaults.keys():
-                audit_obj.add(
-                    key=key,
-                    source=Origin.SCHEMA_DEFAULT.value,
-                    masked=is_secret_key(key),
-                )
+            audit_obj.add_many(defaults.keys(), Origin.SCHEMA_DEFAULT.value, masked=is_secret_key)
     
     # 2. Base .env file
-    if os.path.exists(path):
-        base_vars = _parse_dotenv(path, expand_vars=expand_vars, encrypted=encrypted, encryption_key=encryption_key)
+    base_ctx = _prepare(path)
+    if base_ctx is not None:
+        base_vars = _parse_dotenv(path, expand_vars=expand_vars, encrypted=encrypted, encryption_key=encryption_key, cache=cache, ctx=base_ctx)
         sources["base_file"] = base_vars
         if tracer.enabled:
-            for key in base_vars.keys():
-                tracer.record(key, Origin.FILE_BASE)
+            tracer.record_many(base_vars.keys(), Origin.FILE_BASE)
         if audit_obj:
-            for key in base_vars.keys():
-                audit_obj.add(
-                    key=key,
-                    source=Origin.FILE_BASE.value,
-                    masked=is_secret_key(key),
-                )
+            audit_obj.add_many(base_vars.keys(), Origin.FILE_BASE.value, masked=is_secret_key)
     
     # 3. Environment-specific .env.{env}
     if env:
         base_dir = os.path.dirname(path) or "."
         env_file = os.path.join(base_dir, f".env.{env}")
-        if os.path.exists(env_file):
-            env_vars = _parse_dotenv(env_file, expand_vars=expand_vars, encrypted=encrypted, encryption_key=encryption_key)
+        env_ctx = _prepare(env_file)
+        if env_ctx is not None:
+            env_vars = _parse_dotenv(env_file, expand_vars=expand_vars, encrypted=encrypted, encryption_key=encryption_key, cache=cache, ctx=env_ctx)
             sources["env_specific"] = env_vars
             if tracer.enabled:
-                for key in env_vars.keys():
-                    tracer.record(key, Origin.FILE_ENV_SPECIFIC)
+                tracer.record_many(env_vars.keys(), Origin.FILE_ENV_SPECIFIC)
             if audit_obj:
-                for key in env_vars.keys():
-                    audit_obj.add(
-                        key=key,
-                        source=Origin.FILE_ENV_SPECIFIC.value,
-                        masked=is_secret_key(key),
-                    )
+                audit_obj.add_many(env_vars.keys(), Origin.FILE_ENV_SPECIFIC.value, masked=is_secret_key)
     
     # 4. Docker/K8s mounted secrets
     # Auto-detect and load if available
     try:
-        from ..providers.docker import DockerSecretsProvider, KubernetesSecretsProvider
-        
-        docker_provider = DockerSecretsProvider()
-        k8s_provider = KubernetesSecretsProvider()
-        
-        docker_vars = {}
-        k8s_vars = {}
-        
-        if docker_provider.is_available():
-            docker_vars = docker_provider.get_all()
-        
-        if k8s_provider.is_available():
-            k8s_vars = k8s_provider.get_all()
-        
-        if docker_vars or k8s_vars:
-            sources["docker_k8s"] = {**docker_vars, **k8s_vars}
-            if tracer.enabled:
-                for key in docker_vars.keys():
-                    tracer.record(key, Origin.DOCKER)
-                for key in k8s_vars.keys():
-                    tracer.record(key, Origin.K8S)
-            if audit_obj:
-                for key in docker_vars.keys():
-                    audit_obj.add(
-                        key=key,
-                        source=Origin.DOCKER.value,
-                        provider="DockerSecretsProvider",
-                        masked=is_secret_key(key),
-                    )
-                for key in k8s_vars.keys():
-                    audit_obj.add(
-                        key=key,
-                        source=Origin.K8S.value,
-                        provider="KubernetesSecretsProvider",
-                        masked=is_secret_key(key),
-                    )
+        mounted = _mounted_providers(recheck=watch)
     except ImportError:
-        pass
+        mounted = []
+    
+    for mounted_provider, origin in mounted:
+        mounted_vars = mounted_provider.get_all()
+        if not mounted_vars:
+            continue
+        # Docker first, so Kubernetes values win on shared keys
+        sources.setdefault("docker_k8s", {}).update(mounted_vars)
+        if tracer.enabled:
+            tracer.record_many(mounted_vars.keys(), origin)
+        if audit_obj:
+            audit_obj.add_many(
+                mounted_vars.keys(), origin.value,
+                provider=mounted_provider.__class__.__name__, masked=is_secret_key,
+            )
     
     # 5. System environment variables
-    system_vars = dict(os.environ)
+    # Read-only view; the merger copies it into the result with dict.update
+    system_vars = os.environ
+    if tracer.enabled or audit_obj:
+        # Keys already provided by an earlier source keep that origin
+        seen_keys = set().union(*sources.values())
+        new_keys = [key for key in system_vars if key not in seen_keys]
+        if tracer.enabled:
+            tracer.record_many(new_keys, Origin.SYSTEM)
+        if audit_obj:
+            audit_obj.add_many(new_keys, Origin.SYSTEM.value, masked=is_secret_key)
     sources["system"] = system_vars
-    if tracer.enabled:
-        for key in system_vars.keys():
-            if key not in [k for s in sources.values() for k in s.keys()]:
-                tracer.record(key, Origin.SYSTEM)
-    if audit_obj:
-        for key in system_vars.keys():
-            if key not in audit_obj.entries:
-                audit_obj.add(
-                    key=key,
-                    source=Origin.SYSTEM.value,
-                    masked=is_secret_key(key),
-                )
     
     # 6. Cloud providers (highest priority)
     provider_vars = _load_from_providers(
@@ -441,22 +736,18 @@ def load_env(
     
     # Re-expand variables after merging (in case system vars are referenced)
     if expand_vars:
-        for k, v in list(merged.items()):
-            if isinstance(v, str) and '${' in v:
-                merged[k] = _expand_variables(v, merged)
+        # merged is a fresh dict from the merger, so expand it in place
+        _expand_all(merged, inplace=True)
     
     # Apply defaults for missing keys
     for k, v in defaults.items():
         merged.setdefault(k, str(v))
     
     # Type casting
-    parsed: Dict[str, Any] = {}
-    for k, v in merged.items():
-        cast_to = types.get(k)
-        try:
-            parsed[k] = _cast_value(v, cast_to)
-        except EnvLoaderError:
-            raise
+    parsed: Dict[str, Any] = dict(merged)
+    for k, cast_to in types.items():
+        if k in parsed:
+            parsed[k] = _cast_value(parsed[k], cast_to)
     
     # Replace stringified defaults with original types
     for k, d in defaults.items():
@@ -470,10 +761,10 @@ def load_env(
     known_vars = required | optional | set(types.keys()) | set(defaults.keys())
     
     # Build regex validators
-    compiled_regex = {}
-    if regex_validators:
-        for key, pattern in regex_validators.items():
-            compiled_regex[key] = re.compile(pattern)
+    compiled_regex = {
+        key: _compile_regex(pattern)
+        for key, pattern in (regex_validators or {}).items()
+    }
     
     validator = SchemaValidator(
         strict=strict,
@@ -482,7 +773,7 @@ def load_env(
         deprecated_vars=deprecated_vars,
     )
     
-    validator.validate(parsed, known_vars=list(known_vars), required_vars=list(required))
+    validator.validate(parsed, known_vars=known_vars, required_vars=required)
     
     # Apply policy-as-code if provided
     if config_policy:
@@ -492,25 +783,59 @@ def load_env(
     class ConfigDict(dict):
         """Configuration dictionary with metadata methods."""
         
+        _safe_cache: Optional[Dict[str, Any]] = None
+        
         def safe_repr(self) -> Dict[str, Any]:
-            """Get safe representation with masked secrets."""
-            from ..utils.masking import mask_dict
-            return mask_dict(self, custom_secrets=None)
+            """Get safe representation with masked secrets.
+            
+            The masked mapping is computed once and reused until the
+            config is modified.
+            """
+            if self._safe_cache is None:
+                from ..utils.masking import mask_dict
+                self._safe_cache = mask_dict(self, custom_secrets=None)
+            return dict(self._safe_cache)
+        
+        def __setitem__(self, key, value):
+            self._safe_cache = None
+            super().__setitem__(key, value)
+        
+        def __delitem__(self, key):
+            self._safe_cache = None
+            super().__delitem__(key)
+        
+        def update(self, *args, **kwargs):
+            self._safe_cache = None
+            super().update(*args, **kwargs)
+        
+        def setdefault(self, key, default=None):
+            self._safe_cache = None
+            return super().setdefault(key, default)
+        
+        def pop(self, *args):
+            self._safe_cache = None
+            return super().pop(*args)
+        
+        def popitem(self):
+            self._safe_cache = None
+            return super().popitem()
+        
+        def clear(self):
+            self._safe_cache = None
+            super().clear()
+        
+        def __ior__(self, other):
+            self.update(other)
+            return self
         
         def save(self, filepath: str, format: str = "json") -> None:
             """Save config to file."""
-            if format.lower() == "json":
-                with open(filepath, "w") as f:
-                    json.dump(self.safe_repr(), f, indent=2)
-            elif format.lower() == "yaml":
-                try:
-                    import yaml
-                    with open(filepath, "w") as f:
-                        yaml.dump(self.safe_repr(), f, default_flow_style=False)
-                except ImportError:
-                    raise EnvLoaderError("PyYAML required for YAML export. Install: pip install pyyaml")
-            else:
+            writer = _WRITERS.get(format.lower())
+            if writer is None:
                 raise EnvLoaderError(f"Unsupported format: {format}. Use 'json' or 'yaml'")
+            payload = writer(self.safe_repr())
+            with open(filepath, "wb") as f:
+                f.write(payload)
         
         def get_origins(self) -> Dict[str, str]:
             """Get variable origins (if tracing enabled)."""
@@ -529,8 +854,4 @@ def load_env(
     if trace:
         tracer.print_trace(parsed)
     
-    # Return with audit if requested
-    if audit and audit_obj:
-        return result, audit_obj
-    
-    return result
+    return _LoadResult(result, audit_obj)
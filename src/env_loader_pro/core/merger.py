@@ -1,11 +1,32 @@
 """Configuration source priority resolution and merging."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..core.tracing import Origin, Tracer
 from ..exceptions import ConfigurationError
 from ..settings import SOURCE_PRIORITY
 
+# Default priority order (1 = highest, 6 = lowest)
+_DEFAULT_ORDER = (
+    "cloud_providers",
+    "system",
+    "docker_k8s",
+    "env_specific",
+    "base_file",
+    "schema_defaults",
+)
+_DEFAULT_SOURCES = frozenset(_DEFAULT_ORDER)
+_DEFAULT_SORTED = tuple(sorted(_DEFAULT_ORDER, key=lambda s: SOURCE_PRIORITY.get(s, 999)))
+
+_SOURCE_ORIGINS = {
+    "cloud_providers": Origin.CLOUD_AZURE,  # Default, can be overridden
+    "system": Origin.SYSTEM,
+    "docker_k8s": Origin.DOCKER,
+    "env_specific": Origin.FILE_ENV_SPECIFIC,
+    "base_file": Origin.FILE_BASE,
+    "schema_defaults": Origin.SCHEMA_DEFAULT,
+}
+
 
 class ConfigurationMerger:
     """Merges configuration from multiple sources with deterministic priority."""
@@ -20,7 +41,7 @@ class ConfigurationMerger:
     
     def merge(
         self,
-        sources: Dict[str, Dict[str, Any]],
+        sources: Dict[str, Mapping[str, Any]],
         priority_order: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Merge configuration from multiple sources.
@@ -39,43 +60,38 @@ class ConfigurationMerger:
             ConfigurationError: If priority order is invalid
         """
         if priority_order is None:
-            # Default priority order (1 = highest, 6 = lowest)
-            priority_order = [
-                "cloud_providers",
-                "system",
-                "docker_k8s",
-                "env_specific",
-                "base_file",
-                "schema_defaults",
-            ]
+            known_sources = _DEFAULT_SOURCES
+            sorted_sources = _DEFAULT_SORTED
+        else:
+            known_sources = set(priority_order)
+            # Sort sources by priority (lower number = higher priority)
+            sorted_sources = sorted(
+                priority_order,
+                key=lambda s: SOURCE_PRIORITY.get(s, 999)
+            )
         
         # Validate all sources are in priority order
-        unknown_sources = set(sources.keys()) - set(priority_order)
+        unknown_sources = sources.keys() - known_sources
         if unknown_sources:
             raise ConfigurationError(
                 f"Unknown sources in priority order: {unknown_sources}"
             )
         
-        # Sort sources by priority (lower number = higher priority)
-        sorted_sources = sorted(
-            priority_order,
-            key=lambda s: SOURCE_PRIORITY.get(s, 999)
-        )
+        tracing = self.tracer is not None and self.tracer.enabled
         
         # Merge in priority order (later = higher priority)
         merged: Dict[str, Any] = {}
         
         for source_name in sorted_sources:
-            if source_name not in sources:
+            source_config = sources.get(source_name)
+            if not source_config:
                 continue
             
-            source_config = sources[source_name]
-            
             # Record origins if tracing enabled
-            if self.tracer and self.tracer.enabled:
-                origin = self._get_origin_for_source(source_name)
-                for key in source_config.keys():
-                    self.tracer.record(key, origin)
+            if tracing:
+                self.tracer.record_many(
+                    source_config.keys(), self._get_origin_for_source(source_name)
+                )
             
             # Merge (later sources override earlier ones)
             merged.update(source_config)
@@ -91,15 +107,7 @@ class ConfigurationMerger:
         Returns:
             Origin enum
         """
-        mapping = {
-            "cloud_providers": Origin.CLOUD_AZURE,  # Default, can be overridden
-            "system": Origin.SYSTEM,
-            "docker_k8s": Origin.DOCKER,
-            "env_specific": Origin.FILE_ENV_SPECIFIC,
-            "base_file": Origin.FILE_BASE,
-            "schema_defaults": Origin.SCHEMA_DEFAULT,
-        }
-        return mapping.get(source_name, Origin.UNKNOWN)
+        return _SOURCE_ORIGINS.get(source_name, Origin.UNKNOWN)
     
     def merge_with_override(
         self,
@@ -122,7 +130,6 @@ class ConfigurationMerger:
         
         # Record origins if tracing enabled
         if self.tracer and self.tracer.enabled and origin:
-            for key in override.keys():
-                self.tracer.record(key, origin)
+            self.tracer.record_many(override.keys(), origin)
         
         return merged
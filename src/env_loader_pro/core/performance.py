@@ -55,17 +55,17 @@ class PerformanceMonitor:
         self.sla = sla or PerformanceSLA()
         self.enabled = enabled
         self.metrics = PerformanceMetrics()
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[int] = None  # time.perf_counter_ns()
     
     def start(self) -> None:
         """Start timing."""
         if self.enabled:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter_ns()
     
     def stop(self) -> None:
         """Stop timing and calculate metrics."""
-        if self.enabled and self.start_time:
-            elapsed_ms = (time.time() - self.start_time) * 1000
+        if self.enabled and self.start_time is not None:
+            elapsed_ms = (time.perf_counter_ns() - self.start_time) / 1_000_000
             self.metrics.total_time_ms = elapsed_ms
     
     def record_provider_call(self, provider_name: str, duration_ms: float) -> None:
@@ -145,7 +145,7 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.timeout_seconds = timeout_seconds
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
         self.state = "closed"  # closed, open, half_open
     
     def record_success(self) -> None:
@@ -156,7 +156,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record failed call."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.state = "open"
@@ -169,8 +169,8 @@ class CircuitBreaker:
         """
         if self.state == "open":
             # Check if timeout has passed
-            if self.last_failure_time:
-                elapsed = time.time() - self.last_failure_time
+            if self.last_failure_time is not None:
+                elapsed = time.monotonic() - self.last_failure_time
                 if elapsed >= self.timeout_seconds:
                     self.state = "half_open"
                     return False
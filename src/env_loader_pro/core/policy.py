@@ -1,7 +1,7 @@
 """Failure policy control for provider error handling."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from ..exceptions import ProviderError
 from ..utils.logging import get_logger
@@ -18,6 +18,8 @@ class FailurePolicy(Enum):
 class ProviderResult:
     """Result from a provider operation."""
     
+    __slots__ = ("data", "errors", "metadata")
+    
     def __init__(
         self,
         data: Dict[str, str],
@@ -52,9 +54,63 @@ class ProviderResult:
         return not self.has_errors()
 
 
+class _PolicyTable(dict):
+    """Provider policy dict that counts its own mutations.
+    
+    ``PolicyManager`` compares ``version`` on lookup so edits made
+    directly through ``manager.policies`` invalidate its memo.
+    """
+    
+    __slots__ = ("version",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+    
+    if hasattr(dict, "__ior__"):  # dict |= needs Python 3.9+
+        def __ior__(self, other):
+            result = super().__ior__(other)
+            self.version += 1
+            return result
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+    
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self.version += 1
+        return result
+    
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.version += 1
+        return result
+    
+    def popitem(self):
+        result = super().popitem()
+        self.version += 1
+        return result
+    
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
 class PolicyManager:
     """Manages failure policies for providers."""
     
+    # Maximum number of provider names kept in the lookup memo
+    _CACHE_SIZE = 1024
+    
     def __init__(
         self,
         policies: Optional[Dict[str, str]] = None,
@@ -77,6 +133,36 @@ class PolicyManager:
                     # Invalid policy, use default
                     self.policies[provider] = self.default_policy
     
+    @property
+    def policies(self) -> Dict[str, FailurePolicy]:
+        """Provider policies; direct edits are picked up on the next lookup."""
+        return self._policies
+    
+    @policies.setter
+    def policies(self, policies: Mapping[str, FailurePolicy]) -> None:
+        self._policies = _PolicyTable(policies)
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild the lowercased keys used for partial matching and reset the memo."""
+        self._partial: Tuple[Tuple[str, FailurePolicy], ...] = tuple(
+            (key.lower(), policy) for key, policy in self._policies.items()
+        )
+        # provider name -> resolved policy, oldest first
+        self._policy_cache: Dict[str, FailurePolicy] = {}
+        self._indexed_version = self._policies.version
+    
+    def set_policy(self, provider_name: str, policy: Union[str, FailurePolicy]) -> None:
+        """Set the failure policy for a provider.
+        
+        Args:
+            provider_name: Provider name or name fragment
+            policy: FailurePolicy or its string value
+        """
+        if not isinstance(policy, FailurePolicy):
+            policy = FailurePolicy(policy.lower())
+        self._policies[provider_name] = policy
+    
     def get_policy(self, provider_name: str) -> FailurePolicy:
         """Get failure policy for a provider.
         
@@ -86,14 +172,30 @@ class PolicyManager:
         Returns:
             FailurePolicy enum
         """
+        if self._policies.version != self._indexed_version:
+            self._reindex()
+        
+        cached = self._policy_cache.get(provider_name)
+        if cached is not None:
+            return cached
+        
+        policy = self._resolve_policy(provider_name)
+        if len(self._policy_cache) >= self._CACHE_SIZE:
+            del self._policy_cache[next(iter(self._policy_cache))]
+        self._policy_cache[provider_name] = policy
+        return policy
+    
+    def _resolve_policy(self, provider_name: str) -> FailurePolicy:
+        """Look up a provider's policy without the memo."""
         # Try exact match first
-        if provider_name in self.policies:
-            return self.policies[provider_name]
+        policy = self._policies.get(provider_name)
+        if policy is not None:
+            return policy
         
         # Try partial match (e.g., "AzureKeyVaultProvider" -> "azure")
         provider_lower = provider_name.lower()
-        for key, policy in self.policies.items():
-            if key.lower() in provider_lower or provider_lower in key.lower():
+        for key_lower, policy in self._partial:
+            if key_lower in provider_lower or provider_lower in key_lower:
                 return policy
         
         return self.default_policy
@@ -115,19 +217,16 @@ class PolicyManager:
             ProviderError: If policy is FAIL
         """
         policy = self.get_policy(provider_name)
-        logger = get_logger()
-        
-        error_msg = f"Provider {provider_name} error"
-        if context:
-            error_msg += f" ({context})"
-        error_msg += f": {str(error)}"
+        error_str = str(error)
+        where = f" ({context})" if context else ""
+        error_msg = f"Provider {provider_name} error{where}: {error_str}"
         
-        if policy == FailurePolicy.FAIL:
+        if policy is FailurePolicy.FAIL:
             raise ProviderError(error_msg) from error
-        elif policy == FailurePolicy.WARN:
-            logger.warning(error_msg, provider=provider_name, error=str(error))
-        elif policy == FailurePolicy.FALLBACK:
-            logger.debug(error_msg, provider=provider_name, error=str(error))
+        elif policy is FailurePolicy.WARN:
+            get_logger().warning(error_msg, provider=provider_name, error=error_str)
+        elif policy is FailurePolicy.FALLBACK:
+            get_logger().debug(error_msg, provider=provider_name, error=error_str)
         # FALLBACK: silently continue (already logged at debug level)
     
     def should_continue(self, provider_name: str) -> bool:
@@ -140,7 +239,7 @@ class PolicyManager:
             True if should continue (not FAIL policy)
         """
         policy = self.get_policy(provider_name)
-        return policy != FailurePolicy.FAIL
+        return policy is not FailurePolicy.FAIL
 
 
 def create_default_policies() -> Dict[str, str]:
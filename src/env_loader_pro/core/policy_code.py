@@ -1,13 +1,19 @@
 """Policy-as-code integration for configuration enforcement."""
 
+import copy
 import json
 import os
-from typing import Any, Dict, List, Optional
-
-import yaml
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..exceptions import ConfigurationError, ValidationError
 
+# Parsed policy files: absolute path -> ((mtime_ns, size), data), LRU order
+_POLICY_FILE_CACHE_MAXSIZE = 64
+_POLICY_FILE_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_POLICY_FILE_CACHE_LOCK = threading.Lock()
+
 
 class Policy:
     """Configuration policy for enforcement."""
@@ -44,15 +50,20 @@ class Policy:
         """
         errors = []
         
+        # Probe config per listed key rather than copying all of its keys
+        # into a set; policies are usually far smaller than configs
+        
         # Check required variables
-        missing = set(self.require) - set(config.keys())
-        if missing:
-            errors.append(f"Missing required variables: {', '.join(sorted(missing))}")
+        if self.require:
+            missing = {key for key in self.require if key not in config}
+            if missing:
+                errors.append(f"Missing required variables: {', '.join(sorted(missing))}")
         
         # Check forbidden variables
-        present = set(self.forbid) & set(config.keys())
-        if present:
-            errors.append(f"Forbidden variables present: {', '.join(sorted(present))}")
+        if self.forbid:
+            present = {key for key in self.forbid if key in config}
+            if present:
+                errors.append(f"Forbidden variables present: {', '.join(sorted(present))}")
         
         # Check TTL requirements (if audit available)
         if audit:
@@ -106,21 +117,42 @@ class Policy:
         Raises:
             ConfigurationError: If file cannot be loaded
         """
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise ConfigurationError(f"Policy file not found: {path}")
         
-        with open(path, "r") as f:
-            if path.endswith(".yaml") or path.endswith(".yml"):
+        # Reuse the parsed data while the file is unchanged; the copy keeps
+        # callers that mutate the Policy from touching the cache
+        version = (st.st_mtime_ns, st.st_size)
+        abspath = os.path.abspath(path)
+        with _POLICY_FILE_CACHE_LOCK:
+            cached = _POLICY_FILE_CACHE.get(abspath)
+            if cached is not None and cached[0] == version:
+                _POLICY_FILE_CACHE.move_to_end(abspath)
+                return cls.from_dict(copy.deepcopy(cached[1]))
+        
+        # Bytes go straight to the parsers, which detect UTF-8 themselves
+        with open(path, "rb") as f:
+            if path.endswith((".yaml", ".yml")):
                 try:
-                    data = yaml.safe_load(f)
+                    import yaml
                 except ImportError:
                     raise ConfigurationError(
                         "PyYAML required for YAML policies. Install: pip install pyyaml"
                     )
+                # libyaml's C loader is several times faster than the pure-Python one
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                data = yaml.load(f, Loader=loader)
             else:
                 data = json.load(f)
         
-        return cls.from_dict(data)
+        with _POLICY_FILE_CACHE_LOCK:
+            _POLICY_FILE_CACHE[abspath] = (version, data)
+            _POLICY_FILE_CACHE.move_to_end(abspath)
+            if len(_POLICY_FILE_CACHE) > _POLICY_FILE_CACHE_MAXSIZE:
+                _POLICY_FILE_CACHE.popitem(last=False)
+        return cls.from_dict(copy.deepcopy(data))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert policy to dictionary.
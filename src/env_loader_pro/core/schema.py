@@ -1,11 +1,22 @@
 """Enhanced schema validation with strict mode and advanced validation."""
 
 import re
+import typing
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Pattern, Type, Union
+from dataclasses import MISSING, fields
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Type, Union
+from weakref import WeakKeyDictionary
 
 from ..exceptions import SchemaError, ValidationError
 
+try:
+    from pydantic import BaseModel as _PydanticBase
+except ImportError:
+    _PydanticBase = None
+
+# Schema class -> reflected field info; dropped when the class goes away
+_SCHEMA_CACHE: "WeakKeyDictionary[type, Dict[str, Any]]" = WeakKeyDictionary()
+
 
 class SchemaValidator:
     """Validates configuration against schema with strict mode support."""
@@ -36,25 +47,25 @@ class SchemaValidator:
     def validate(
         self,
         config: Dict[str, Any],
-        known_vars: Optional[List[str]] = None,
-        required_vars: Optional[List[str]] = None,
+        known_vars: Optional[Iterable[str]] = None,
+        required_vars: Optional[Iterable[str]] = None,
     ) -> None:
         """Validate configuration.
         
         Args:
             config: Configuration dictionary
-            known_vars: List of known/expected variable names
-            required_vars: List of required variable names
+            known_vars: Known/expected variable names
+            required_vars: Required variable names
         
         Raises:
             ValidationError: If validation fails
             SchemaError: If strict mode violations occur
         """
-        known_vars = set(known_vars or [])
-        required_vars = set(required_vars or [])
+        known_vars = _as_set(known_vars)
+        required_vars = _as_set(required_vars)
         
         # Check required variables
-        missing = required_vars - set(config.keys())
+        missing = required_vars.difference(config)
         if missing:
             raise ValidationError(
                 f"Missing required variables: {', '.join(sorted(missing))}"
@@ -67,7 +78,10 @@ class SchemaValidator:
         
         # Strict mode: check for unknown variables
         if self.strict:
-            unknown = set(config.keys()) - known_vars - required_vars
+            unknown = {
+                key for key in config
+                if key not in known_vars and key not in required_vars
+            }
             if unknown:
                 msg = f"Unknown variables found: {', '.join(sorted(unknown))}"
                 if self.warn_only:
@@ -76,7 +90,7 @@ class SchemaValidator:
                     raise SchemaError(msg)
         
         # Check deprecated variables
-        deprecated_found = self.deprecated_vars & set(config.keys())
+        deprecated_found = [var for var in self.deprecated_vars if var in config]
         if deprecated_found:
             for var in deprecated_found:
                 warnings.warn(
@@ -138,24 +152,52 @@ def extract_schema_info(
     Returns:
         Dictionary with extracted schema information
     """
-    field_names = _get_schema_fields(schema)
-    field_types = _get_field_types(schema)
-    field_defaults = _get_field_defaults(schema)
+    try:
+        info = _SCHEMA_CACHE.get(schema)
+    except TypeError:  # not weak-referenceable
+        info = None
+    if info is None:
+        info = _reflect_schema(schema)
+        try:
+            _SCHEMA_CACHE[schema] = info
+        except TypeError:
+            pass
     
+    # Fresh containers per call; default factories run every time
+    defaults_mapping = dict(info["defaults"])
+    for upper_name, factory in info["default_factories"].items():
+        defaults_mapping[upper_name] = factory()
+    
+    return {
+        "field_names": list(info["field_names"]),
+        "types": dict(info["types"]),
+        "defaults": defaults_mapping,
+        "required": list(info["required"]),
+        "optional": list(info["optional"]),
+    }
+
+
+def _reflect_schema(schema: Union[Type, Any]) -> Dict[str, Any]:
+    """Collect the parts of a schema that do not change between calls."""
     # Map to uppercase for env vars
+    field_names = []
     types_mapping = {}
     defaults_mapping = {}
+    factories_mapping = {}
     required_vars = []
     optional_vars = []
     
-    for field_name in field_names:
-        upper_name = field_name.upper()
-        types_mapping[upper_name] = field_types.get(field_name, str)
+    for name, field_type, default, factory, required in _introspect(schema):
+        upper_name = name.upper()
+        field_names.append(name)
+        types_mapping[upper_name] = field_type
         
-        if field_name in field_defaults:
-            defaults_mapping[upper_name] = field_defaults[field_name]
+        if default is not MISSING:
+            defaults_mapping[upper_name] = default
+        elif factory is not MISSING:
+            factories_mapping[upper_name] = factory
         
-        if _is_required_field(schema, field_name):
+        if required:
             required_vars.append(upper_name)
         else:
             optional_vars.append(upper_name)
@@ -164,112 +206,68 @@ def extract_schema_info(
         "field_names": field_names,
         "types": types_mapping,
         "defaults": defaults_mapping,
+        "default_factories": factories_mapping,
         "required": required_vars,
         "optional": optional_vars,
     }
 
 
-def _get_schema_fields(schema: Union[Type, Any]) -> List[str]:
-    """Extract field names from schema."""
-    # Try Pydantic
-    try:
-        from pydantic import BaseModel
-        if issubclass(schema, BaseModel):
-            return list(schema.__fields__.keys())
-    except (ImportError, TypeError):
-        pass
-    
-    # Try dataclass
-    try:
-        from dataclasses import fields
-        if hasattr(schema, '__dataclass_fields__'):
-            return [f.name for f in fields(schema)]
-    except Exception:
-        pass
-    
-    return []
+def _as_set(names: Optional[Iterable[str]]) -> AbstractSet[str]:
+    """Return names as a set, reusing it if it already is one."""
+    if isinstance(names, (set, frozenset)):
+        return names
+    return frozenset(names or ())
 
 
-def _is_required_field(schema: Union[Type, Any], field_name: str) -> bool:
-    """Check if a field is required."""
-    # Try Pydantic
-    try:
-        from pydantic import BaseModel
-        if issubclass(schema, BaseModel):
-            field = schema.__fields__.get(field_name)
-            if field:
-                return field.required
-    except (ImportError, TypeError):
-        pass
-    
-    # Try dataclass
-    try:
-        from dataclasses import fields, MISSING
-        if hasattr(schema, '__dataclass_fields__'):
-            for f in fields(schema):
-                if f.name == field_name:
-                    return f.default == MISSING and f.default_factory == MISSING
-    except Exception:
-        pass
-    
-    return True
+def _is_pydantic(schema: Union[Type, Any]) -> bool:
+    """Check whether schema is a Pydantic model class."""
+    return (
+        _PydanticBase is not None
+        and isinstance(schema, type)
+        and issubclass(schema, _PydanticBase)
+    )
 
 
-def _get_field_types(schema: Union[Type, Any]) -> Dict[str, type]:
-    """Extract type hints from schema."""
-    types = {}
+def _introspect(schema: Union[Type, Any]) -> Iterator[Tuple[str, Any, Any, Any, bool]]:
+    """Walk schema fields once.
     
+    Args:
+        schema: Pydantic model or dataclass
+    
+    Yields:
+        (name, type, default, default_factory, required) per field, with
+        ``dataclasses.MISSING`` for an absent default or factory
+    """
     # Try Pydantic
-    try:
-        from pydantic import BaseModel
-        if issubclass(schema, BaseModel):
-            for name, field in schema.__fields__.items():
-                types[name] = field.outer_type_ if hasattr(field, 'outer_type_') else field.type_
-    except (ImportError, TypeError):
-        pass
+    if _is_pydantic(schema):
+        for name, field in schema.__fields__.items():
+            field_type = field.outer_type_ if hasattr(field, 'outer_type_') else field.type_
+            required = field.required
+            default = field.default if not required and hasattr(field, 'default') else MISSING
+            yield name, field_type, default, MISSING, required
+        return
     
     # Try dataclass
+    if not hasattr(schema, '__dataclass_fields__'):
+        return
     try:
-        from dataclasses import fields
-        import typing
-        if hasattr(schema, '__dataclass_fields__'):
-            for f in fields(schema):
-                types[f.name] = f.type
-                # Handle Optional types
-                if hasattr(typing, 'get_origin') and typing.get_origin(f.type) is Union:
-                    args = typing.get_args(f.type)
-                    if len(args) == 2 and type(None) in args:
-                        types[f.name] = [a for a in args if a is not type(None)][0]
-    except Exception:
-        pass
-    
-    return types
+        schema_fields = fields(schema)
+    except TypeError:
+        return
+    for f in schema_fields:
+        yield (
+            f.name,
+            _unwrap_optional(f.type),
+            f.default,
+            f.default_factory if f.default is MISSING else MISSING,
+            f.default is MISSING and f.default_factory is MISSING,
+        )
 
 
-def _get_field_defaults(schema: Union[Type, Any]) -> Dict[str, Any]:
-    """Extract default values from schema."""
-    defaults = {}
-    
-    # Try Pydantic
-    try:
-        from pydantic import BaseModel
-        if issubclass(schema, BaseModel):
-            for name, field in schema.__fields__.items():
-                if not field.required and hasattr(field, 'default'):
-                    defaults[name] = field.default
-    except (ImportError, TypeError):
-        pass
-    
-    # Try dataclass
-    try:
-        from dataclasses import fields, MISSING
-        if hasattr(schema, '__dataclass_fields__'):
-            for f in fields(schema):
-                if f.default != MISSING:
-                    defaults[f.name] = f.default
-                elif f.default_factory != MISSING:
-                    defaults[f.name] = f.default_factory()
-    except Exception:
-        pass
-    
-    return defaults
+def _unwrap_optional(field_type: Any) -> Any:
+    """Reduce ``Optional[X]`` to ``X``; other types are returned unchanged."""
+    if typing.get_origin(field_type) is Union:
+        args = typing.get_args(field_type)
+        if len(args) == 2 and type(None) in args:
+            return [a for a in args if a is not type(None)][0]
+    return field_type
@@ -1,8 +1,13 @@
 """Variable origin tracking and observability."""
 
-from typing import Dict, Optional
+import sys
+from collections import Counter
+from operator import attrgetter
+from typing import Dict, Iterable, Optional
 from enum import Enum
 
+from ..utils.masking import is_secret_key, mask_value
+
 
 class Origin(Enum):
     """Configuration source origins."""
@@ -52,6 +57,27 @@ class Tracer:
         if metadata:
             self._metadata[key] = metadata
     
+    def record_many(
+        self,
+        keys: Iterable[str],
+        origin: Origin,
+        metadata: Optional[Dict[str, any]] = None
+    ) -> None:
+        """Record the same origin for several variables.
+        
+        Args:
+            keys: Variable key names
+            origin: Source origin
+            metadata: Optional metadata shared by all keys
+        """
+        if not self.enabled:
+            return
+        
+        keys = dict.fromkeys(keys, origin)
+        self._origins.update(keys)
+        if metadata:
+            self._metadata.update(dict.fromkeys(keys, metadata))
+    
     def get_origin(self, key: str) -> Optional[Origin]:
         """Get the origin of a variable.
         
@@ -80,7 +106,8 @@ class Tracer:
         Returns:
             Dictionary mapping keys to origin strings
         """
-        return {k: v.value for k, v in self._origins.items()}
+        # _value_ is the plain attribute behind the Enum.value descriptor
+        return {k: v._value_ for k, v in self._origins.items()}
     
     def get_origin_summary(self) -> Dict[str, int]:
         """Get summary of origins by type.
@@ -88,10 +115,8 @@ class Tracer:
         Returns:
             Dictionary mapping origin types to counts
         """
-        summary: Dict[str, int] = {}
-        for origin in self._origins.values():
-            summary[origin.value] = summary.get(origin.value, 0) + 1
-        return summary
+        # Count the value strings; hashing Origin members is slower
+        return dict(Counter(map(attrgetter("_value_"), self._origins.values())))
     
     def format_trace(self, key: str) -> str:
         """Format a trace entry for a variable.
@@ -122,17 +147,16 @@ class Tracer:
         if not self.enabled:
             return
         
-        print("=== Configuration Trace ===")
+        # Build the whole report and write it once
+        lines = ["=== Configuration Trace ==="]
         
         if config:
-            from ..utils.masking import is_secret_key, mask_value
-            
-            for key in sorted(self._origins.keys()):
-                origin = self.get_origin(key)
+            mask_secrets = self.mask_secrets
+            for key, origin in sorted(self._origins.items()):
                 value = config.get(key)
                 
                 # Mask secrets if enabled
-                if self.mask_secrets and is_secret_key(key):
+                if mask_secrets and is_secret_key(key):
                     value_str = mask_value(value)
                 else:
                     value_str = str(value)
@@ -140,16 +164,18 @@ class Tracer:
                 if len(value_str) > 50:
                     value_str = value_str[:47] + "..."
                 
-                print(f"  {key:30} = {value_str:30} [{origin.value if origin else 'unknown'}]")
+                lines.append(f"  {key:30} = {value_str:30} [{origin.value}]")
         else:
-            for key in sorted(self._origins.keys()):
-                print(f"  {self.format_trace(key)}")
+            for key in sorted(self._origins):
+                lines.append(f"  {self.format_trace(key)}")
         
-        print()
-        print("=== Origin Summary ===")
+        lines.append("")
+        lines.append("=== Origin Summary ===")
         summary = self.get_origin_summary()
         for origin, count in sorted(summary.items()):
-            print(f"  {origin:20} : {count} variables")
+            lines.append(f"  {origin:20} : {count} variables")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
     
     def clear(self) -> None:
         """Clear all trace data."""
@@ -3,7 +3,7 @@
 from .age import AgeDecryptor
 from .decryptor import Decryptor, DecryptorRegistry, get_decryptor_registry
 from .gpg import GPGDecryptor
-from .lifecycle import decrypt_file, encrypt_file, re_encrypt_file
+from .lifecycle import bulk_decrypt_files, decrypt_file, encrypt_file, re_encrypt_file
 
 __all__ = [
     "Decryptor",
@@ -11,6 +11,7 @@ __all__ = [
     "get_decryptor_registry",
     "AgeDecryptor",
     "GPGDecryptor",
+    "bulk_decrypt_files",
     "decrypt_file",
     "encrypt_file",
     "re_encrypt_file",
@@ -1,14 +1,27 @@
 """age encryption/decryption support."""
 
 import subprocess
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from ..exceptions import DecryptionError
 from .decryptor import Decryptor
 
+try:
+    import pyrage
+except ImportError:
+    pyrage = None
+
 
 class AgeDecryptor(Decryptor):
-    """Decryptor for age-encrypted files."""
+    """Decryptor for age-encrypted files.
+    
+    Uses the pyrage bindings in-process when they are installed and the
+    identity file holds native age keys, avoiding a fork+exec per file.
+    Otherwise the ``age`` command is run.
+    """
+    
+    # Result of probing the age command, shared by all instances
+    _cli_available: Optional[bool] = None
     
     def decrypt(self, encrypted_path: str, key: Optional[str] = None) -> str:
         """Decrypt an age-encrypted file.
@@ -23,41 +36,109 @@ class AgeDecryptor(Decryptor):
         Raises:
             DecryptionError: If decryption fails
         """
+        content = b"".join(self.decrypt_stream(encrypted_path, key)).decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+    
+    def decrypt_stream(self, encrypted_path: str, key: Optional[str] = None) -> Iterator[bytes]:
+        """Decrypt an age-encrypted file, yielding plaintext lines as bytes.
+        
+        Lines are read from the age process as it produces them, so
+        callers that parse incrementally never hold the whole plaintext.
+        
+        Args:
+            encrypted_path: Path to encrypted file
+            key: Optional path to age identity file
+        
+        Yields:
+            Decrypted lines, including line endings
+        
+        Raises:
+            DecryptionError: If decryption fails (raised once the output
+                has been consumed, when the process exit status is known)
+        """
+        if pyrage is not None and key:
+            identities = self._load_identities(key)
+            if identities:
+                yield from self._decrypt_in_process(encrypted_path, identities).splitlines(True)
+                return
+        
+        cmd = ["age", "--decrypt"]
+        
+        if key:
+            cmd.extend(["-i", key])
+        
+        cmd.append(encrypted_path)
+        
         try:
-            cmd = ["age", "--decrypt"]
-            
-            if key:
-                cmd.extend(["-i", key])
-            
-            cmd.append(encrypted_path)
-            
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-            
-            return result.stdout
         except FileNotFoundError:
             raise DecryptionError(
                 "age tool not found. Install age: https://github.com/FiloSottile/age"
             )
-        except subprocess.CalledProcessError as e:
+        except Exception as e:
+            raise DecryptionError(f"Unexpected error during age decryption: {str(e)}")
+        
+        with proc:
+            yield from proc.stdout
+            stderr = proc.stderr.read()
+            returncode = proc.wait()
+        
+        if returncode != 0:
             raise DecryptionError(
-                f"age decryption failed: {e.stderr or str(e)}"
+                f"age decryption failed: {stderr.decode('utf-8', 'replace') or f'exit status {returncode}'}"
             )
+    
+    @staticmethod
+    def _load_identities(key_path: str) -> List[object]:
+        """Read native age identities from an identity file.
+        
+        Returns an empty list if the file holds none (e.g. SSH keys), so the
+        caller can fall back to the age command.
+        """
+        try:
+            with open(key_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            return [
+                pyrage.x25519.Identity.from_str(line.strip())
+                for line in lines
+                if line.strip().startswith("AGE-SECRET-KEY-")
+            ]
         except Exception as e:
-            raise DecryptionError(f"Unexpected error during age decryption: {str(e)}")
+            raise DecryptionError(f"Failed to read age identity file {key_path}: {str(e)}")
+    
+    @staticmethod
+    def _decrypt_in_process(encrypted_path: str, identities: List[object]) -> bytes:
+        """Decrypt a file with pyrage."""
+        try:
+            with open(encrypted_path, "rb") as f:
+                ciphertext = f.read()
+            return pyrage.decrypt(ciphertext, identities)
+        except Exception as e:
+            raise DecryptionError(f"age decryption failed: {str(e)}")
     
     def is_available(self) -> bool:
         """Check if age is available.
         
         Returns:
-            True if age command is available
+            True if pyrage is installed or the age command is available
         """
+        if pyrage is not None:
+            return True
+        if AgeDecryptor._cli_available is None:
+            AgeDecryptor._cli_available = self._probe_cli()
+        return AgeDecryptor._cli_available
+    
+    @staticmethod
+    def _probe_cli() -> bool:
+        """Run ``age --version`` to check the command is installed."""
         try:
-            result = subprocess.run(
+            subprocess.run(
                 ["age", "--version"],
                 capture_output=True,
                 text=True,
@@ -1,7 +1,8 @@
 """Generic decryption interface for encrypted .env files."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from itertools import chain
+from typing import Iterator, List, Optional
 
 from ..exceptions import DecryptionError
 
@@ -41,6 +42,8 @@ class DecryptorRegistry:
     def __init__(self):
         """Initialize registry."""
         self._decryptors: list[Decryptor] = []
+        # Decryptors whose tool was found, probed once after each register()
+        self._available: Optional[List[Decryptor]] = None
     
     def register(self, decryptor: Decryptor) -> None:
         """Register a decryptor.
@@ -49,6 +52,13 @@ class DecryptorRegistry:
             decryptor: Decryptor instance
         """
         self._decryptors.append(decryptor)
+        self._available = None
+    
+    def _available_decryptors(self) -> List[Decryptor]:
+        """Registered decryptors whose tools are installed, in order."""
+        if self._available is None:
+            self._available = [d for d in self._decryptors if d.is_available()]
+        return self._available
     
     def decrypt(self, encrypted_path: str, key: Optional[str] = None) -> str:
         """Try to decrypt using registered decryptors.
@@ -65,10 +75,7 @@ class DecryptorRegistry:
         """
         errors = []
         
-        for decryptor in self._decryptors:
-            if not decryptor.is_available():
-                continue
-            
+        for decryptor in self._available_decryptors():
             try:
                 return decryptor.decrypt(encrypted_path, key)
             except DecryptionError as e:
@@ -76,7 +83,48 @@ class DecryptorRegistry:
             except Exception as e:
                 errors.append(f"{decryptor.__class__.__name__}: Unexpected error: {str(e)}")
         
-        raise DecryptionError(
+        raise self._failure(encrypted_path, errors)
+    
+    def decrypt_stream(self, encrypted_path: str, key: Optional[str] = None) -> Iterator[bytes]:
+        """Decrypt using registered decryptors, returning plaintext chunks.
+        
+        Decryptors with a ``decrypt_stream`` method are streamed; others
+        are decrypted in full. A decryptor that fails before producing
+        any output falls through to the next one, while a failure after
+        output has started is raised from the returned iterator.
+        
+        Args:
+            encrypted_path: Path to encrypted file
+            key: Optional decryption key
+        
+        Returns:
+            Iterator over decrypted bytes
+        
+        Raises:
+            DecryptionError: If all decryptors fail
+        """
+        errors = []
+        
+        for decryptor in self._available_decryptors():
+            try:
+                stream = getattr(decryptor, "decrypt_stream", None)
+                if stream is None:
+                    chunks = iter((decryptor.decrypt(encrypted_path, key).encode("utf-8"),))
+                else:
+                    chunks = stream(encrypted_path, key)
+                first = next(chunks, b"")
+            except DecryptionError as e:
+                errors.append(f"{decryptor.__class__.__name__}: {str(e)}")
+            except Exception as e:
+                errors.append(f"{decryptor.__class__.__name__}: Unexpected error: {str(e)}")
+            else:
+                return chain((first,), chunks)
+        
+        raise self._failure(encrypted_path, errors)
+    
+    def _failure(self, encrypted_path: str, errors: List[str]) -> DecryptionError:
+        """Build the error raised when no decryptor succeeded."""
+        return DecryptionError(
             f"Failed to decrypt {encrypted_path}. Tried {len(self._decryptors)} decryptors. "
             f"Errors: {', '.join(errors)}"
         )
@@ -1,11 +1,38 @@
 """GPG encryption/decryption support."""
 
+import os
+import shutil
 import subprocess
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence
 
 from ..exceptions import DecryptionError
 from .decryptor import Decryptor
 
+# Bytes read from gpg per chunk
+_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=8)
+def _gpg_available(binary: str) -> bool:
+    """Run ``gpg --version`` once per resolved binary path.
+    
+    Use ``_gpg_available.cache_clear()`` to force a re-probe.
+    """
+    try:
+        subprocess.run(
+            [binary, "--version"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return True
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return False
+    except Exception:
+        return False
+
 
 class GPGDecryptor(Decryptor):
     """Decryptor for GPG-encrypted files."""
@@ -23,35 +50,97 @@ class GPGDecryptor(Decryptor):
         Raises:
             DecryptionError: If decryption fails
         """
+        out = bytearray()
+        for chunk in self.decrypt_stream(encrypted_path, key):
+            out += chunk
+        content = out.decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+    
+    def decrypt_stream(self, encrypted_path: str, key: Optional[str] = None) -> Iterator[bytes]:
+        """Decrypt a GPG-encrypted file, yielding plaintext in chunks.
+        
+        Args:
+            encrypted_path: Path to encrypted file
+            key: Optional passphrase (not recommended, use GPG agent instead)
+        
+        Yields:
+            Decrypted bytes, up to ``_CHUNK_SIZE`` at a time
+        
+        Raises:
+            DecryptionError: If decryption fails (raised once the output
+                has been consumed, when the process exit status is known)
+        """
+        cmd = ["gpg", "--decrypt", "--quiet", "--yes"]
+        
+        if key:
+            # Note: Using passphrase via command line is insecure
+            # Better to use GPG agent or keyring
+            cmd.extend(["--passphrase", key, "--batch"])
+        
+        cmd.append(encrypted_path)
+        
         try:
-            cmd = ["gpg", "--decrypt", "--quiet", "--yes"]
-            
-            if key:
-                # Note: Using passphrase via command line is insecure
-                # Better to use GPG agent or keyring
-                cmd.extend(["--passphrase", key, "--batch"])
-            
-            cmd.append(encrypted_path)
-            
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=_CHUNK_SIZE,
             )
-            
-            return result.stdout
         except FileNotFoundError:
             raise DecryptionError(
                 "GPG not found. Install GPG: https://www.gnupg.org/"
             )
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr or e.stdout or str(e)
+        except Exception as e:
+            raise DecryptionError(f"Unexpected error during GPG decryption: {str(e)}")
+        
+        with proc:
+            read = proc.stdout.read
+            chunk = read(_CHUNK_SIZE)
+            while chunk:
+                yield chunk
+                chunk = read(_CHUNK_SIZE)
+            stderr = proc.stderr.read()
+            returncode = proc.wait()
+        
+        if returncode != 0:
+            error_msg = stderr.decode("utf-8", "replace") or f"exit status {returncode}"
             raise DecryptionError(
                 f"GPG decryption failed: {error_msg}"
             )
-        except Exception as e:
-            raise DecryptionError(f"Unexpected error during GPG decryption: {str(e)}")
+    
+    def decrypt_many(
+        self,
+        paths: Sequence[str],
+        key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Decrypt several GPG-encrypted files concurrently.
+        
+        Each file still gets its own gpg process (``--multifile`` can only
+        write plaintext next to the input files), but the processes run
+        side by side and share the running gpg-agent's unlocked keys.
+        
+        Args:
+            paths: Paths to encrypted files
+            key: Optional passphrase (not recommended, use GPG agent instead)
+            max_workers: Maximum concurrent gpg processes (default: CPU count)
+        
+        Returns:
+            Dictionary mapping each path to its decrypted content
+        
+        Raises:
+            DecryptionError: If any file fails to decrypt
+        """
+        unique = list(dict.fromkeys(paths))
+        if len(unique) <= 1:
+            return {path: self.decrypt(path, key) for path in unique}
+        
+        workers = min(len(unique), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.decrypt, path, key) for path in unique]
+        return {path: future.result() for path, future in zip(unique, futures)}
     
     def is_available(self) -> bool:
         """Check if GPG is available.
@@ -59,15 +148,6 @@ class GPGDecryptor(Decryptor):
         Returns:
             True if gpg command is available
         """
-        try:
-            result = subprocess.run(
-                ["gpg", "--version"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            return False
-        except Exception:
-            return False
+        # PATH lookup only stats files; the probe runs once per binary
+        binary = shutil.which("gpg")
+        return binary is not None and _gpg_available(binary)
@@ -1,12 +1,18 @@
 """Encrypted configuration lifecycle management."""
 
 import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence
 
 from ..exceptions import DecryptionError
 
+# Trailing characters of tool stderr kept in error messages
+_STDERR_LIMIT = 4096
+
 
 def encrypt_file(
     input_path: str,
@@ -52,10 +58,7 @@ def decrypt_file(
         DecryptionError: If decryption fails
     """
     if output_path is None:
-        if input_path.endswith(".enc"):
-            output_path = input_path[:-4]
-        else:
-            output_path = f"{input_path}.decrypted"
+        output_path = _decrypted_path(input_path)
     
     # Use decryptor registry
     from .decryptor import get_decryptor_registry
@@ -67,6 +70,50 @@ def decrypt_file(
         f.write(decrypted_content)
 
 
+def bulk_decrypt_files(
+    paths: Sequence[str],
+    key_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """Decrypt several encrypted .env files concurrently.
+    
+    Each file is decrypted by its own age/gpg subprocess, so the calls
+    overlap in a thread pool instead of paying tool startup serially.
+    
+    Args:
+        paths: Paths to encrypted files
+        key_path: Path to decryption key
+        max_workers: Maximum concurrent decryptions (default: CPU count)
+    
+    Returns:
+        Output paths, in the same order as ``paths``
+    
+    Raises:
+        DecryptionError: If any file fails to decrypt
+    """
+    outputs = [_decrypted_path(path) for path in paths]
+    if not outputs:
+        return outputs
+    
+    workers = min(len(outputs), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(decrypt_file, path, output, key_path)
+            for path, output in zip(paths, outputs)
+        ]
+    # Surface the first failure in input order
+    for future in futures:
+        future.result()
+    return outputs
+
+
+def _decrypted_path(input_path: str) -> str:
+    """Default output path for a decrypted file."""
+    if input_path.endswith(".enc"):
+        return input_path[:-4]
+    return f"{input_path}.decrypted"
+
+
 def _encrypt_with_age(
     input_path: str,
     output_path: str,
@@ -74,13 +121,7 @@ def _encrypt_with_age(
 ) -> None:
     """Encrypt file with age."""
     try:
-        cmd = ["age", "--encrypt"]
-        
-        if key_path:
-            cmd.extend(["-i", key_path])
-        
-        cmd.append("-o")
-        cmd.append(output_path)
+        cmd = _age_command(output_path, key_path)
         
         with open(input_path, "rb") as f:
             result = subprocess.run(
@@ -88,13 +129,15 @@ def _encrypt_with_age(
                 stdin=f,
                 capture_output=True,
                 check=True,
+                text=True,
+                errors="replace",
             )
     except FileNotFoundError:
         raise DecryptionError(
             "age tool not found. Install age: https://github.com/FiloSottile/age"
         )
     except subprocess.CalledProcessError as e:
-        raise DecryptionError(f"age encryption failed: {e.stderr.decode() if e.stderr else str(e)}")
+        raise DecryptionError(f"age encryption failed: {e.stderr[-_STDERR_LIMIT:] or str(e)}")
 
 
 def _encrypt_with_gpg(
@@ -104,25 +147,103 @@ def _encrypt_with_gpg(
 ) -> None:
     """Encrypt file with GPG."""
     try:
-        cmd = ["gpg", "--encrypt", "--output", output_path]
-        
-        if key_path:
-            # GPG recipient key
-            cmd.extend(["--recipient", key_path])
-        
+        cmd = _gpg_command(output_path, key_path)
         cmd.append(input_path)
         
         result = subprocess.run(
             cmd,
             capture_output=True,
             check=True,
+            text=True,
+            errors="replace",
         )
     except FileNotFoundError:
         raise DecryptionError(
             "GPG not found. Install GPG: https://www.gnupg.org/"
         )
     except subprocess.CalledProcessError as e:
-        raise DecryptionError(f"GPG encryption failed: {e.stderr.decode() if e.stderr else str(e)}")
+        raise DecryptionError(f"GPG encryption failed: {e.stderr[-_STDERR_LIMIT:] or str(e)}")
+
+
+def _age_command(output_path: str, key_path: Optional[str] = None) -> List[str]:
+    """Build the age command line; plaintext is read from stdin."""
+    cmd = ["age", "--encrypt"]
+    
+    if key_path:
+        cmd.extend(["-i", key_path])
+    
+    cmd.extend(["-o", output_path])
+    return cmd
+
+
+def _gpg_command(output_path: str, key_path: Optional[str] = None) -> List[str]:
+    """Build the GPG command line; without an input path it reads stdin."""
+    cmd = ["gpg", "--encrypt", "--output", output_path]
+    
+    if key_path:
+        # GPG recipient key
+        cmd.extend(["--recipient", key_path])
+    
+    return cmd
+
+
+def _encrypt_stream(
+    chunks: Iterable[bytes],
+    output_path: str,
+    method: str,
+    key_path: Optional[str] = None,
+) -> None:
+    """Encrypt plaintext chunks by piping them to the tool's stdin.
+    
+    Args:
+        chunks: Plaintext chunks
+        output_path: Path to output file
+        method: Encryption method (age, gpg)
+        key_path: Path to encryption key
+    
+    Raises:
+        DecryptionError: If encryption fails
+    """
+    if method == "age":
+        cmd = _age_command(output_path, key_path)
+        name = "age"
+        missing = "age tool not found. Install age: https://github.com/FiloSottile/age"
+    else:
+        cmd = _gpg_command(output_path, key_path)
+        name = "GPG"
+        missing = "GPG not found. Install GPG: https://www.gnupg.org/"
+    
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise DecryptionError(missing)
+    
+    try:
+        for chunk in chunks:
+            proc.stdin.write(chunk)
+    except BrokenPipeError:
+        # Tool exited early; its exit status and stderr are reported below
+        pass
+    except BaseException:
+        proc.kill()
+        proc.communicate()
+        raise
+    
+    try:
+        _, stderr = proc.communicate()
+    except BrokenPipeError:
+        stderr = proc.stderr.read()
+        proc.wait()
+    if proc.returncode != 0:
+        raise DecryptionError(
+            f"{name} encryption failed: "
+            f"{stderr[-_STDERR_LIMIT:].decode(errors='replace') if stderr else proc.returncode}"
+        )
 
 
 def re_encrypt_file(
@@ -142,28 +263,26 @@ def re_encrypt_file(
     Raises:
         DecryptionError: If operation fails
     """
-    # Decrypt to memory
     from .decryptor import get_decryptor_registry
     
-    registry = get_decryptor_registry()
-    decrypted_content = registry.decrypt(encrypted_path, key_path)
-    
     # Determine method from output path or use same
     if output_path is None:
         output_path = encrypted_path
     
     method = new_method or ("age" if encrypted_path.endswith(".age") else "gpg")
+    if method not in ("age", "gpg"):
+        raise DecryptionError(f"Unsupported encryption method: {method}")
     
-    # Re-encrypt
-    # Write to temp file first, then encrypt
-    import tempfile
-    
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".tmp") as tmp:
-        tmp.write(decrypted_content)
-        tmp_path = tmp.name
+    # Plaintext is piped from the decryptor straight into the encryptor.
+    # Ciphertext goes to a private directory next to the output and is
+    # moved into place on success, so output_path may equal encrypted_path.
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(output_path)))
+    tmp_path = os.path.join(tmp_dir, os.path.basename(output_path))
     
     try:
-        encrypt_file(tmp_path, output_path, method=method, key_path=key_path)
+        registry = get_decryptor_registry()
+        chunks = registry.decrypt_stream(encrypted_path, key_path)
+        _encrypt_stream(chunks, tmp_path, method, key_path)
+        os.replace(tmp_path, output_path)
     finally:
-        # Clean up temp file
-        os.unlink(tmp_path)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
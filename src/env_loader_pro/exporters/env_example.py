@@ -1,6 +1,6 @@
 """Generate .env.example files from schema."""
 
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional
 
 
 def generate_env_example(
@@ -21,42 +21,62 @@ def generate_env_example(
         output_path: Output file path
         comments: Optional comments per variable
     """
-    lines = []
-    lines.append("# Environment Configuration")
-    lines.append("# Copy this file to .env and fill in your values")
-    lines.append("")
+    # Render before opening so a formatting error leaves no partial file
+    content = "\n".join(_example_lines(
+        frozenset(required or ()),
+        frozenset(optional or ()),
+        defaults or {},
+        types or {},
+        comments or {},
+    ))
     
-    all_vars = set(required or []) | set(optional or []) | set(defaults.keys()) | set(types.keys())
-    comments = comments or {}
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _example_lines(
+    required: FrozenSet[str],
+    optional: FrozenSet[str],
+    defaults: Mapping[str, Any],
+    types: Mapping[str, Callable],
+    comments: Mapping[str, str],
+) -> Iterator[str]:
+    """Yield .env.example lines, one per section header or variable."""
+    yield "# Environment Configuration"
+    yield "# Copy this file to .env and fill in your values"
+    yield ""
+    
+    # Type-hint comments, formatted once per distinct type
+    type_comments: Dict[Any, str] = {}
+    defaults_get = defaults.get
+    comments_get = comments.get
+    types_get = types.get
+    
+    def entry(var: str) -> str:
+        comment = comments_get(var)
+        if comment is None:
+            type_hint = types_get(var, str)
+            comment = type_comments.get(type_hint)
+            if comment is None:
+                comment = type_comments[type_hint] = f"  # {type_hint.__name__}"
+        return f"{var}={defaults_get(var, '')}{comment}"
     
     if required:
-        lines.append("# Required variables")
+        yield "# Required variables"
         for var in sorted(required):
-            default_val = defaults.get(var, "")
-            type_hint = types.get(var, str)
-            comment = comments.get(var, f"  # {type_hint.__name__}")
-            lines.append(f"{var}={default_val}{comment}")
-        lines.append("")
+            yield entry(var)
+        yield ""
     
     if optional:
-        lines.append("# Optional variables")
+        yield "# Optional variables"
         for var in sorted(optional):
             if var not in required:
-                default_val = defaults.get(var, "")
-                type_hint = types.get(var, str)
-                comment = comments.get(var, f"  # {type_hint.__name__}")
-                lines.append(f"{var}={default_val}{comment}")
-        lines.append("")
+                yield entry(var)
+        yield ""
     
     # Other variables from defaults/types
-    other_vars = (set(defaults.keys()) | set(types.keys())) - set(required or []) - set(optional or [])
+    other_vars = (defaults.keys() | types.keys()) - required - optional
     if other_vars:
-        lines.append("# Additional variables")
+        yield "# Additional variables"
         for var in sorted(other_vars):
-            default_val = defaults.get(var, "")
-            type_hint = types.get(var, str)
-            comment = comments.get(var, f"  # {type_hint.__name__}")
-            lines.append(f"{var}={default_val}{comment}")
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+            yield entry(var)
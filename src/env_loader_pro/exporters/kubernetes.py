@@ -1,9 +1,94 @@
 """Export configuration to Kubernetes ConfigMap and Secret YAML."""
 
-from typing import Any, Dict, List, Optional
+from binascii import b2a_base64
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils.masking import is_secret_key
 
+# Escapes for YAML double-quoted scalars
+_YAML_ESCAPE = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+# Manifest header; metadata fields such as namespace follow it
+_HEADER_TEMPLATE = "apiVersion: v1\nkind: {kind}\nmetadata:\n  name: {name}"
+
+
+def _metadata_lines(
+    kind: str,
+    name: str,
+    namespace: Optional[str],
+    labels: Optional[Dict[str, str]],
+) -> List[str]:
+    """Build the apiVersion/kind/metadata header shared by all manifests."""
+    yaml_lines = [_HEADER_TEMPLATE.format(kind=kind, name=name)]
+    
+    if namespace:
+        yaml_lines.append(f"  namespace: {namespace}")
+    
+    if labels:
+        yaml_lines.append("  labels:")
+        for key, value in labels.items():
+            yaml_lines.append(f"    {key}: {value}")
+    
+    return yaml_lines
+
+
+def _partition(config: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Split configuration into (non-secret, secret) string values."""
+    non_secrets: Dict[str, str] = {}
+    secrets: Dict[str, str] = {}
+    for key, value in config.items():
+        (secrets if is_secret_key(key) else non_secrets)[key] = str(value)
+    return non_secrets, secrets
+
+
+def _configmap_yaml(
+    non_secrets: Dict[str, str],
+    name: str,
+    namespace: Optional[str],
+    labels: Optional[Dict[str, str]],
+) -> str:
+    """Render a ConfigMap manifest from already-filtered string values."""
+    yaml_lines = _metadata_lines("ConfigMap", name, namespace, labels)
+    
+    yaml_lines.append("data:")
+    for key, value in sorted(non_secrets.items()):
+        # Escape special YAML characters
+        value_escaped = value.translate(_YAML_ESCAPE)
+        yaml_lines.append(f"  {key}: \"{value_escaped}\"")
+    
+    return "\n".join(yaml_lines)
+
+
+def _secret_yaml(
+    secrets: Dict[str, str],
+    name: str,
+    namespace: Optional[str],
+    labels: Optional[Dict[str, str]],
+    encode_base64: bool,
+) -> str:
+    """Render a Secret manifest from already-filtered string values."""
+    yaml_lines = _metadata_lines("Secret", name, namespace, labels)
+    
+    yaml_lines.append("type: Opaque")
+    yaml_lines.append("data:")
+    
+    for key, value in sorted(secrets.items()):
+        if encode_base64:
+            encoded = b2a_base64(value.encode("utf-8"), newline=False).decode("ascii")
+            yaml_lines.append(f"  {key}: {encoded}")
+        else:
+            # Kubernetes requires base64, but allow plain for debugging
+            value_escaped = value.translate(_YAML_ESCAPE)
+            yaml_lines.append(f"  {key}: \"{value_escaped}\"")
+    
+    return "\n".join(yaml_lines)
+
 
 def export_configmap(
     config: Dict[str, Any],
@@ -22,31 +107,8 @@ def export_configmap(
     Returns:
         YAML string
     """
-    # Filter out secrets
-    non_secrets = {k: str(v) for k, v in config.items() if not is_secret_key(k)}
-    
-    yaml_lines = [
-        "apiVersion: v1",
-        "kind: ConfigMap",
-        f"metadata:",
-        f"  name: {name}",
-    ]
-    
-    if namespace:
-        yaml_lines.append(f"  namespace: {namespace}")
-    
-    if labels:
-        yaml_lines.append("  labels:")
-        for key, value in labels.items():
-            yaml_lines.append(f"    {key}: {value}")
-    
-    yaml_lines.append("data:")
-    for key, value in sorted(non_secrets.items()):
-        # Escape special YAML characters
-        value_escaped = str(value).replace('"', '\\"')
-        yaml_lines.append(f"  {key}: \"{value_escaped}\"")
-    
-    return "\n".join(yaml_lines)
+    non_secrets, _ = _partition(config)
+    return _configmap_yaml(non_secrets, name, namespace, labels)
 
 
 def export_secret(
@@ -68,39 +130,8 @@ def export_secret(
     Returns:
         YAML string
     """
-    import base64
-    
-    # Filter only secrets
-    secrets = {k: str(v) for k, v in config.items() if is_secret_key(k)}
-    
-    yaml_lines = [
-        "apiVersion: v1",
-        "kind: Secret",
-        f"metadata:",
-        f"  name: {name}",
-    ]
-    
-    if namespace:
-        yaml_lines.append(f"  namespace: {namespace}")
-    
-    if labels:
-        yaml_lines.append("  labels:")
-        for key, value in labels.items():
-            yaml_lines.append(f"    {key}: {value}")
-    
-    yaml_lines.append("type: Opaque")
-    yaml_lines.append("data:")
-    
-    for key, value in sorted(secrets.items()):
-        if encode_base64:
-            encoded = base64.b64encode(value.encode("utf-8")).decode("utf-8")
-            yaml_lines.append(f"  {key}: {encoded}")
-        else:
-            # Kubernetes requires base64, but allow plain for debugging
-            value_escaped = str(value).replace('"', '\\"')
-            yaml_lines.append(f"  {key}: \"{value_escaped}\"")
-    
-    return "\n".join(yaml_lines)
+    _, secrets = _partition(config)
+    return _secret_yaml(secrets, name, namespace, labels, encode_base64)
 
 
 def export_kubernetes(
@@ -122,8 +153,10 @@ def export_kubernetes(
     Returns:
         Dictionary with 'configmap' and 'secret' keys containing YAML strings
     """
-    configmap_yaml = export_configmap(config, configmap_name, namespace)
-    secret_yaml = export_secret(config, secret_name, namespace)
+    # Classify each key once for both manifests
+    non_secrets, secrets = _partition(config)
+    configmap_yaml = _configmap_yaml(non_secrets, configmap_name, namespace, None)
+    secret_yaml = _secret_yaml(secrets, secret_name, namespace, None, True)
     
     if output_path:
         # Write separate files
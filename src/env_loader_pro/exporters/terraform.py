@@ -1,6 +1,65 @@
 """Export configuration to Terraform .tfvars format."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+# Escapes for HCL quoted strings
+_HCL_ESCAPE = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+
+def _format_str(value: str) -> str:
+    return f'"{value.translate(_HCL_ESCAPE)}"'
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _format_list(value: list) -> str:
+    # Convert list to HCL format
+    items = [_format_str(item) if isinstance(item, str) else str(item) for item in value]
+    return f"[{', '.join(items)}]"
+
+
+# HCL formatter per value type; subclasses resolve through their MRO
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: _format_str,
+    bool: _format_bool,
+    int: str,
+    float: str,
+    list: _format_list,
+}
+
+
+def _format_value(value: Any) -> str:
+    """Format a value as an HCL literal."""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is None:
+        formatter = next(
+            (_FORMATTERS[cls] for cls in type(value).__mro__ if cls in _FORMATTERS),
+            None,
+        )
+        if formatter is None:
+            return _format_str(str(value))
+    return formatter(value)
+
+
+def _tfvars_lines(config: Dict[str, Any], sensitive_keys: Set[str]) -> Iterator[str]:
+    """Yield .tfvars lines for a configuration."""
+    yield "# Terraform variables"
+    yield "# Generated from env-loader-pro"
+    yield ""
+    
+    for key, value in sorted(config.items()):
+        if key in sensitive_keys:
+            yield f"# {key} = \"<sensitive>\"  # Set this value manually"
+        else:
+            yield f"{key} = {_format_value(value)}"
 
 
 def export_tfvars(
@@ -15,37 +74,11 @@ def export_tfvars(
         output_path: Output file path
         sensitive_keys: Optional list of keys to mark as sensitive (commented out)
     """
-    sensitive_keys = set(sensitive_keys or [])
-    
-    lines = []
-    lines.append("# Terraform variables")
-    lines.append("# Generated from env-loader-pro")
-    lines.append("")
-    
-    for key, value in sorted(config.items()):
-        is_sensitive = key in sensitive_keys
-        
-        if is_sensitive:
-            lines.append(f"# {key} = \"<sensitive>\"  # Set this value manually")
-        else:
-            # Format value appropriately
-            if isinstance(value, str):
-                # Escape quotes
-                value_str = value.replace('"', '\\"')
-                lines.append(f'{key} = "{value_str}"')
-            elif isinstance(value, bool):
-                lines.append(f"{key} = {str(value).lower()}")
-            elif isinstance(value, (int, float)):
-                lines.append(f"{key} = {value}")
-            elif isinstance(value, list):
-                # Convert list to HCL format
-                items = [f'"{item}"' if isinstance(item, str) else str(item) for item in value]
-                lines.append(f"{key} = [{', '.join(items)}]")
-            else:
-                lines.append(f'{key} = "{str(value)}"')
+    # Render before opening so a formatting error leaves no partial file
+    content = "\n".join(_tfvars_lines(config, set(sensitive_keys or [])))
     
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(content)
 
 
 def export_tfvars_json(
@@ -1,6 +1,7 @@
 """FastAPI integration for dependency injection."""
 
-from typing import Any, Callable, Dict, Optional, Type
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Type
 from functools import lru_cache
 
 try:
@@ -8,6 +9,43 @@ try:
 except ImportError:
     Depends = None
 
+# Shared loaders for identical config_dependency() call sites
+_LOADERS: Dict[Hashable, Callable[[], Any]] = {}
+_LOADERS_LOCK = threading.Lock()
+
+
+def _memoize(load: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap a zero-argument loader so it runs at most once, even under threads."""
+    lock = threading.Lock()
+    result = []
+    
+    def get_config():
+        if not result:
+            with lock:
+                if not result:
+                    result.append(load())
+        return result[0]
+    
+    return get_config
+
+
+def _shared_loader(key: Hashable, load: Callable[[], Any]) -> Callable[[], Any]:
+    """Return the memoized loader for ``key``, creating it on first use.
+    
+    Keys that are not hashable (e.g. a list of providers in the load
+    arguments) get an unshared loader.
+    """
+    try:
+        hash(key)
+    except TypeError:
+        return _memoize(load)
+    
+    with _LOADERS_LOCK:
+        loader = _LOADERS.get(key)
+        if loader is None:
+            loader = _LOADERS[key] = _memoize(load)
+    return loader
+
 
 def config_dependency(
     schema: Optional[Type] = None,
@@ -38,14 +76,16 @@ def config_dependency(
     from ..core.loader import load_env
     from ..schema import load_with_schema
     
-    @lru_cache()
-    def get_config():
+    def load():
         if schema:
             return load_with_schema(schema, path=path, env=env, **load_env_kwargs)
         else:
             return load_env(path=path, env=env, **load_env_kwargs)
     
-    return Depends(get_config)
+    # One callable per distinct configuration, so call sites share a load
+    # and FastAPI sees the same dependency everywhere
+    key = (schema, path, env, tuple(sorted(load_env_kwargs.items())))
+    return Depends(_shared_loader(key, load))
 
 
 def inject_config(
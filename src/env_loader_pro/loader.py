@@ -17,8 +17,13 @@ _DEFAULT_SECRET_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
     r".*pwd.*",
 ]]
 
+# All default patterns as one alternation, tried in a single match
+_SECRET_RE = re.compile(
+    "|".join("(?:%s)" % p.pattern for p in _DEFAULT_SECRET_PATTERNS), re.IGNORECASE
+)
+
 def _is_secret(key: str) -> bool:
-    return any(p.match(key) for p in _DEFAULT_SECRET_PATTERNS)
+    return _SECRET_RE.match(key) is not None
 
 def _mask(value: Any) -> str:
     if value is None:
@@ -78,6 +83,15 @@ def _cast_value(value: str, to_type: Optional[Callable]) -> Any:
     except Exception as e:
         raise EnvLoaderError(f"Failed to cast env value '{value}' to {to_type}: {e}")
 
+def _strip_quotes(val: str) -> str:
+    """Strip whitespace and surrounding quotes with a single slice where possible."""
+    val = val.strip()
+    if not val or (val[0] not in "\"'" and val[-1] not in "\"'"):
+        return val
+    if len(val) >= 2 and val[0] == val[-1]:
+        return val[1:-1]
+    return val.strip('"').strip("'")
+
 def _parse_dotenv(path: str, expand_vars: bool = True, encrypted: bool = False, encryption_key: Optional[str] = None) -> Dict[str, str]:
     out: Dict[str, str] = {}
     if not os.path.exists(path):
@@ -104,7 +118,7 @@ def _parse_dotenv(path: str, expand_vars: bool = True, encrypted: bool = False,
             continue
         key, val = line.split("=", 1)
         key = key.strip()
-        val = val.strip().strip('"').strip("'")
+        val = _strip_quotes(val)
         out[key] = val
     
     # Expand variables if requested
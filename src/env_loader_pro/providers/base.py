@@ -1,5 +1,6 @@
 """Base provider interface for configuration sources."""
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
@@ -1,5 +1,6 @@
 """Schema support for Pydantic and dataclasses."""
-from typing import Any, Dict, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 def load_with_schema(
     schema: Union[Type, Any],
@@ -47,16 +48,23 @@ def load_with_schema(
     normalized_config = {}
     
     # First, map all config values to their schema field names (case-insensitive)
+    lookup = _field_lookup(tuple(field_names))
     for key, value in config.items():
-        # Find matching field name (case-insensitive)
-        for field_name in field_names:
-            if key.upper() == field_name.upper():
-                normalized_config[field_name] = value
-                break
+        field_name = lookup.get(key.upper())
+        if field_name is not None:
+            normalized_config[field_name] = value
     
     # Convert to schema instance
     return _to_schema_instance(schema, normalized_config)
 
+@lru_cache(maxsize=128)
+def _field_lookup(field_names: Tuple[str, ...]) -> Dict[str, str]:
+    """Map upper-cased names to schema field names (first field wins)."""
+    lookup = {}
+    for field_name in field_names:
+        lookup.setdefault(field_name.upper(), field_name)
+    return lookup
+
 def _get_schema_fields(schema: Union[Type, Any]) -> list:
     """Extract field names from schema."""
     # Try Pydantic
@@ -60,6 +60,10 @@ class EnvLoaderLogger:
             message: Log message
             **kwargs: Additional context (will be masked if mask_secrets=True)
         """
+        # Skip masking and formatting for levels that would be dropped
+        if not self.logger.isEnabledFor(level):
+            return
+        
         if kwargs and self.mask_secrets:
             # Mask secrets in kwargs
             kwargs = mask_dict(kwargs)
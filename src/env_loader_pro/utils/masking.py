@@ -1,10 +1,21 @@
 """Secret masking utilities for safe logging."""
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Pattern
 
 from ..settings import DEFAULT_SECRET_PATTERNS
 
+# All default patterns folded into one alternation so each key is scanned once
+_SECRET_RE = re.compile(
+    "|".join("(?:%s)" % p for p in DEFAULT_SECRET_PATTERNS), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_default_secret(key: str) -> bool:
+    return _SECRET_RE.match(key) is not None
+
 
 def is_secret_key(key: str, patterns: Optional[List[Pattern]] = None) -> bool:
     """Check if a key should be treated as a secret.
@@ -17,7 +28,7 @@ def is_secret_key(key: str, patterns: Optional[List[Pattern]] = None) -> bool:
         True if key matches secret patterns
     """
     if patterns is None:
-        patterns = [re.compile(p, re.IGNORECASE) for p in DEFAULT_SECRET_PATTERNS]
+        return _is_default_secret(key)
     
     return any(p.match(key) for p in patterns)
 
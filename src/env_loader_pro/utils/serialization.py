@@ -0,0 +1,43 @@
+"""JSON serialization shared by the loader and the CLI."""
+
+import json
+from typing import Any
+
+# orjson module, False if not installed, None until first use
+_orjson: Any = None
+
+
+def _get_orjson() -> Any:
+    """Import orjson on first use so importing the package stays cheap."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = False
+        _orjson = orjson
+    return _orjson
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available.
+
+    The output is equivalent JSON but not byte-identical to ``json.dumps``:
+    orjson writes non-ASCII characters as UTF-8 instead of ``\\uXXXX``
+    escapes and NaN/Infinity as ``null``. Values orjson cannot encode
+    (e.g. integers wider than 64 bits) fall back to ``json.dumps``.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    orjson = _get_orjson()
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
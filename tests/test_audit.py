@@ -2,7 +2,7 @@
 import pytest
 import tempfile
 import os
-from src.env_loader_pro.core.loader import load_env
+from src.env_loader_pro.core.loader import load_env, load_env_with_audit
 from src.env_loader_pro.core.audit import ConfigAudit, AuditEntry
 from datetime import datetime
 
@@ -38,6 +38,20 @@ def test_audit_basic():
         os.unlink(f.name)
 
 
+def test_load_env_with_audit():
+    """Test load_env_with_audit always returns (config, audit)."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env') as f:
+        f.write("PORT=8080")
+        f.flush()
+        
+        config, audit = load_env_with_audit(path=f.name)
+        
+        assert config["PORT"] == "8080"
+        assert "PORT" in audit.entries
+        
+        os.unlink(f.name)
+
+
 def test_audit_json_export():
     """Test audit JSON export."""
     audit = ConfigAudit()
@@ -67,6 +81,20 @@ def test_audit_summary():
     assert "aws" in summary["sources"]
 
 
+def test_audit_summary_counts():
+    """Test summary counts per source and provider."""
+    audit = ConfigAudit()
+    audit.add("KEY1", "file", masked=False)
+    audit.add("KEY2", "file", masked=False)
+    audit.add("KEY3", "azure", provider="AzureKeyVaultProvider", masked=True)
+    
+    summary = audit.get_summary()
+    assert summary["sources"] == {"file": 2, "azure": 1}
+    assert summary["providers"] == {"AzureKeyVaultProvider": 1}
+    assert summary["masked_variables"] == 1
+    assert type(summary["sources"]) is dict
+
+
 def test_audit_ci_mode():
     """Test audit in CI mode (no providers)."""
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env') as f:
@@ -81,3 +109,104 @@ def test_audit_ci_mode():
         assert "PORT" in audit.entries
         
         os.unlink(f.name)
+
+
+def test_audit_write_json():
+    """Test streaming JSON export matches to_json."""
+    import io
+    import json
+    
+    audit = ConfigAudit()
+    audit.add("PORT", "file", masked=False)
+    audit.add("API_KEY", "azure", provider="AzureSecretProvider", masked=True)
+    
+    buf = io.StringIO()
+    audit.write_json(buf)
+    assert json.loads(buf.getvalue()) == json.loads(audit.to_json())
+
+
+def test_audit_add_many():
+    """Test bulk audit entries share a source and timestamp."""
+    audit = ConfigAudit()
+    audit.add_many(["PORT", "API_KEY"], "file", masked=lambda key: key == "API_KEY")
+    
+    assert audit.get("PORT").masked is False
+    assert audit.get("API_KEY").masked is True
+    assert audit.get("PORT").timestamp == audit.get("API_KEY").timestamp
+    assert audit.get_summary()["sources"] == {"file": 2}
+
+
+def test_audit_provider_without_trace():
+    """Test provider values are audited even when tracing is off."""
+    class FakeAWSProvider:
+        def get_all(self):
+            return {"DB_PASSWORD": "hunter2"}
+    
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env') as f:
+        f.write("PORT=8080")
+        f.flush()
+        
+        config, audit = load_env(path=f.name, audit=True, providers=[FakeAWSProvider()])
+        
+        entry = audit.get("DB_PASSWORD")
+        assert entry is not None
+        assert entry.source == "aws"
+        assert entry.provider == "FakeAWSProvider"
+        assert entry.masked is True
+        
+        os.unlink(f.name)
+
+
+def test_audit_buffered_add_order():
+    """Test buffered additions keep add-time timestamps and last-write-wins."""
+    audit = ConfigAudit()
+    audit.add("PORT", "file", masked=False, timestamp=1.0)
+    assert audit.get("PORT").source == "file"
+    audit.add("PORT", "system", masked=False, timestamp=2.0)
+    audit.add_many(["HOST"], "system", masked=False)
+    
+    assert list(audit.entries) == ["PORT", "HOST"]
+    assert audit.get("PORT").source == "system"
+    assert audit.get("PORT").timestamp == 2.0
+
+
+def test_audit_system_vars_recorded(monkeypatch):
+    """Test system vars are audited without overriding file sources."""
+    monkeypatch.setenv("AUDIT_SYSTEM_ONLY", "1")
+    monkeypatch.setenv("PORT", "9000")
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env') as f:
+        f.write("PORT=8080")
+        f.flush()
+        
+        config, audit = load_env(path=f.name, audit=True)
+        
+        assert audit.get("PORT").source == "file"
+        assert audit.get("AUDIT_SYSTEM_ONLY").source == "system"
+        system = audit.get_by_source("system")
+        assert "PORT" not in system
+        assert set(os.environ) - {"PORT"} <= set(system)
+        
+        os.unlink(f.name)
+
+
+def test_audit_to_json_matches_json_dumps():
+    """Test to_json output is identical to json.dumps of to_dict."""
+    import json
+    
+    audit = ConfigAudit()
+    audit.add("CAFÉ", "file", masked=False, timestamp=1.5)
+    audit.add("API_KEY", "azure", provider="AzureSecretProvider", masked=True, timestamp=2.0)
+    
+    assert audit.to_json() == json.dumps(audit.to_dict(), indent=2)
+
+
+def test_audit_entry_accepts_str_subclasses():
+    """Test sources that are str subclasses (e.g. Enum members) are accepted."""
+    from enum import Enum
+    
+    class Source(str, Enum):
+        FILE = "file"
+    
+    entry = AuditEntry("PORT", Source.FILE, provider=Source.FILE, masked=False)
+    assert entry.source == "file"
+    assert entry.provider == "file"
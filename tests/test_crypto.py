@@ -0,0 +1,246 @@
+"""Tests for encrypted file support."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+from src.env_loader_pro.crypto import decryptor as decryptor_module
+from src.env_loader_pro.crypto import (
+    AgeDecryptor,
+    Decryptor,
+    DecryptorRegistry,
+    GPGDecryptor,
+    bulk_decrypt_files,
+    decrypt_file,
+    encrypt_file,
+    re_encrypt_file,
+)
+from src.env_loader_pro.exceptions import DecryptionError
+
+RECIPIENT = "env-loader-pro-test@example.com"
+CONTENT = "PORT=8080\nAPI_KEY=secret123\n"
+
+needs_gpg = pytest.mark.skipif(shutil.which("gpg") is None, reason="gpg not installed")
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="uses shell scripts")
+
+
+@pytest.fixture
+def gpg_home(monkeypatch):
+    """Isolated GnuPG home with an unprotected key for RECIPIENT."""
+    # Short path: gpg-agent's socket path has a length limit
+    home = tempfile.mkdtemp(prefix="gpg")
+    monkeypatch.setenv("GNUPGHOME", home)
+    subprocess.run(
+        ["gpg", "--batch", "--passphrase", "", "--quick-gen-key", RECIPIENT,
+         "default", "default", "never"],
+        check=True,
+        capture_output=True,
+    )
+    yield home
+    subprocess.run(["gpgconf", "--kill", "gpg-agent"], capture_output=True)
+    shutil.rmtree(home, ignore_errors=True)
+
+
+def _write_encrypted(tmp_path, name="app.env.gpg", content=CONTENT):
+    plain = tmp_path / f"{name}.plain"
+    plain.write_text(content)
+    encrypted = tmp_path / name
+    encrypt_file(str(plain), str(encrypted), method="gpg", key_path=RECIPIENT)
+    plain.unlink()
+    return encrypted
+
+
+def _fake_tool(tmp_path, monkeypatch, name, script):
+    """Put a shell script called ``name`` first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir(exist_ok=True)
+    tool = bin_dir / name
+    tool.write_text("#!/bin/sh\n" + script)
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+class FakeDecryptor(Decryptor):
+    """Decryptor that yields ``chunks`` and then optionally fails."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    def decrypt(self, encrypted_path, key=None):
+        return b"".join(self.decrypt_stream(encrypted_path, key)).decode("utf-8")
+
+    def decrypt_stream(self, encrypted_path, key=None):
+        yield from self.chunks
+        if self.error is not None:
+            raise DecryptionError(self.error)
+
+    def is_available(self):
+        return True
+
+
+def _registry(*decryptors):
+    registry = DecryptorRegistry()
+    for decryptor in decryptors:
+        registry.register(decryptor)
+    return registry
+
+
+@needs_gpg
+def test_gpg_round_trip(tmp_path, gpg_home):
+    """Test encrypt_file, GPGDecryptor and decrypt_file with real gpg."""
+    encrypted = _write_encrypted(tmp_path)
+    assert CONTENT.encode() not in encrypted.read_bytes()
+
+    assert GPGDecryptor().decrypt(str(encrypted)) == CONTENT
+
+    output = tmp_path / "decrypted.env"
+    decrypt_file(str(encrypted), str(output))
+    assert output.read_text() == CONTENT
+
+
+@needs_gpg
+def test_gpg_decrypt_stream_chunks(tmp_path, gpg_home):
+    """Test large plaintext is streamed back in bounded chunks."""
+    content = "".join(f"KEY_{i}=value_{i}\n" for i in range(10000))
+    encrypted = _write_encrypted(tmp_path, content=content)
+
+    chunks = list(GPGDecryptor().decrypt_stream(str(encrypted)))
+    assert len(chunks) > 1
+    assert max(map(len, chunks)) <= 64 * 1024
+    assert b"".join(chunks).decode("utf-8") == content
+
+
+@needs_gpg
+def test_gpg_decrypt_many_and_bulk_decrypt(tmp_path, gpg_home):
+    """Test batch decryption of several files."""
+    first = _write_encrypted(tmp_path, "one.env.enc", "A=1\n")
+    second = _write_encrypted(tmp_path, "two.env.enc", "B=2\n")
+
+    result = GPGDecryptor().decrypt_many([str(first), str(second), str(first)])
+    assert result == {str(first): "A=1\n", str(second): "B=2\n"}
+
+    outputs = bulk_decrypt_files([str(first), str(second)])
+    assert outputs == [str(tmp_path / "one.env"), str(tmp_path / "two.env")]
+    assert (tmp_path / "one.env").read_text() == "A=1\n"
+    assert (tmp_path / "two.env").read_text() == "B=2\n"
+
+
+@needs_gpg
+def test_gpg_decrypt_many_reports_failure(tmp_path, gpg_home):
+    """Test a bad file in a batch raises DecryptionError."""
+    good = _write_encrypted(tmp_path)
+    bad = tmp_path / "bad.gpg"
+    bad.write_bytes(b"not encrypted")
+
+    with pytest.raises(DecryptionError):
+        GPGDecryptor().decrypt_many([str(good), str(bad)])
+
+
+@needs_gpg
+def test_re_encrypt_file_in_place(tmp_path, gpg_home):
+    """Test re-encrypting over the input leaves only new ciphertext behind."""
+    encrypted = _write_encrypted(tmp_path)
+    before = encrypted.read_bytes()
+
+    re_encrypt_file(str(encrypted), key_path=RECIPIENT, new_method="gpg")
+
+    assert encrypted.read_bytes() != before
+    assert GPGDecryptor().decrypt(str(encrypted)) == CONTENT
+    assert sorted(p.name for p in tmp_path.iterdir()) == [encrypted.name]
+
+
+@needs_gpg
+def test_re_encrypt_file_failure_leaves_output_untouched(tmp_path, gpg_home, monkeypatch):
+    """Test a decryptor failing after partial output does not touch the output."""
+    encrypted = _write_encrypted(tmp_path)
+    before = encrypted.read_bytes()
+    registry = _registry(FakeDecryptor([b"PORT=8080\n"], error="truncated"))
+    monkeypatch.setattr(decryptor_module, "get_decryptor_registry", lambda: registry)
+
+    with pytest.raises(DecryptionError, match="truncated"):
+        re_encrypt_file(str(encrypted), key_path=RECIPIENT, new_method="gpg")
+
+    assert encrypted.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == [encrypted.name]
+
+
+def test_re_encrypt_file_rejects_unknown_method(tmp_path):
+    """Test unsupported methods fail before anything is written."""
+    encrypted = tmp_path / "app.env.gpg"
+    encrypted.write_bytes(b"ciphertext")
+
+    with pytest.raises(DecryptionError, match="Unsupported encryption method"):
+        re_encrypt_file(str(encrypted), new_method="rot13")
+
+    assert encrypted.read_bytes() == b"ciphertext"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [encrypted.name]
+
+
+def test_registry_decrypt_stream_falls_through_before_output():
+    """Test a decryptor failing before any output falls through to the next."""
+    registry = _registry(
+        FakeDecryptor([], error="wrong key"),
+        FakeDecryptor([b"A=1\n", b"B=2\n"]),
+    )
+
+    assert b"".join(registry.decrypt_stream("app.env.enc")) == b"A=1\nB=2\n"
+
+
+def test_registry_decrypt_stream_raises_after_partial_output():
+    """Test a failure after output has started is raised from the iterator."""
+    registry = _registry(
+        FakeDecryptor([b"A=1\n"], error="truncated"),
+        FakeDecryptor([b"never used\n"]),
+    )
+
+    chunks = registry.decrypt_stream("app.env.enc")
+    assert next(chunks) == b"A=1\n"
+    with pytest.raises(DecryptionError, match="truncated"):
+        next(chunks)
+
+
+def test_registry_decrypt_stream_all_fail():
+    """Test the error lists every decryptor that was tried."""
+    registry = _registry(FakeDecryptor([], error="first"), FakeDecryptor([], error="second"))
+
+    with pytest.raises(DecryptionError, match="Tried 2 decryptors.*first.*second"):
+        registry.decrypt_stream("app.env.enc")
+
+
+@posix_only
+def test_gpg_decrypt_stream_nonzero_exit_after_output(tmp_path, monkeypatch):
+    """Test gpg exiting non-zero after partial output raises DecryptionError."""
+    _fake_tool(tmp_path, monkeypatch, "gpg", 'echo "A=1"\necho "gpg: decryption failed" >&2\nexit 2\n')
+
+    chunks = GPGDecryptor().decrypt_stream(str(tmp_path / "app.env.gpg"))
+    assert next(chunks) == b"A=1\n"
+    with pytest.raises(DecryptionError, match="decryption failed"):
+        next(chunks)
+
+
+@posix_only
+def test_age_decrypt_stream_cli(tmp_path, monkeypatch):
+    """Test the age command path yields lines and reports a failing exit."""
+    monkeypatch.setattr("src.env_loader_pro.crypto.age.pyrage", None)
+    _fake_tool(tmp_path, monkeypatch, "age", 'printf "A=1\\r\\nB=2\\n"\n')
+    assert list(AgeDecryptor().decrypt_stream("app.env.age")) == [b"A=1\r\n", b"B=2\n"]
+    assert AgeDecryptor().decrypt("app.env.age") == "A=1\nB=2\n"
+
+    _fake_tool(tmp_path, monkeypatch, "age", 'echo "A=1"\necho "no identity matched" >&2\nexit 1\n')
+    with pytest.raises(DecryptionError, match="no identity matched"):
+        AgeDecryptor().decrypt("app.env.age")
+
+
+def test_age_pyrage_round_trip(tmp_path):
+    """Test in-process age decryption with pyrage."""
+    pyrage = pytest.importorskip("pyrage")
+    identity = pyrage.x25519.Identity.generate()
+    key_file = tmp_path / "key.txt"
+    key_file.write_text(f"# test key\n{identity}\n")
+    encrypted = tmp_path / "app.env.age"
+    encrypted.write_bytes(pyrage.encrypt(CONTENT.encode(), [identity.to_public()]))
+
+    assert AgeDecryptor().decrypt(str(encrypted), str(key_file)) == CONTENT
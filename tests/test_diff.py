@@ -80,3 +80,11 @@ def test_diff_validate_no_secret_changes():
     if is_secret_key("API_KEY"):
         with pytest.raises(ValueError, match="Secret changes detected"):
             diff_with_secret.validate_no_secret_changes()
+
+
+def test_diff_same_object():
+    """Test diffing a config against itself."""
+    config = {"PORT": 8080}
+    
+    diff = diff_configs(config, config)
+    assert not diff.has_changes()
@@ -0,0 +1,36 @@
+"""Tests for configuration exporters."""
+import yaml
+from src.env_loader_pro.exporters import export_configmap, export_secret, export_tfvars
+
+
+TRICKY = 'back\\slash "quoted"\nnext\tline'
+
+
+def test_configmap_escapes_special_characters():
+    """Test ConfigMap values with backslashes, quotes and newlines round-trip."""
+    text = export_configmap({"GREETING": TRICKY})
+
+    assert '  GREETING: "back\\\\slash \\"quoted\\"\\nnext\\tline"' in text.splitlines()
+    assert yaml.safe_load(text)["data"]["GREETING"] == TRICKY
+
+
+def test_secret_plain_escapes_special_characters():
+    """Test plain (non-base64) Secret values round-trip."""
+    text = export_secret({"API_KEY": TRICKY}, encode_base64=False)
+
+    assert yaml.safe_load(text)["data"]["API_KEY"] == TRICKY
+
+
+def test_tfvars_escapes_special_characters(tmp_path):
+    """Test tfvars strings and list items are escaped for HCL."""
+    output = tmp_path / "terraform.tfvars"
+    export_tfvars(
+        {"GREETING": TRICKY, "HOSTS": ['a"b', "c\\d"], "PORT": 8080, "DEBUG": True},
+        output_path=str(output),
+    )
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert 'GREETING = "back\\\\slash \\"quoted\\"\\nnext\\tline"' in lines
+    assert 'HOSTS = ["a\\"b", "c\\\\d"]' in lines
+    assert "PORT = 8080" in lines
+    assert "DEBUG = true" in lines
@@ -44,6 +44,12 @@ def test_variable_expansion_circular(tmp_path):
     with pytest.raises(EnvLoaderError, match="Circular reference"):
         load_env(path=str(env_file))
 
+def test_variable_expansion_circular_names_cycle_member(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("A=${B}\nB=${C}\nC=${B}")
+    with pytest.raises(EnvLoaderError, match=r"variable: B \(B -> C -> B\)"):
+        load_env(path=str(env_file))
+
 def test_list_parsing_json(tmp_path):
     env_file = tmp_path / ".env"
     env_file.write_text('DOMAINS=["a.com","b.com","c.com"]')
@@ -144,6 +150,18 @@ def test_generate_env_example(tmp_path):
     assert "PORT=8080" in content
     assert "DEBUG=False" in content
 
+def test_generate_env_example_without_defaults_or_types(tmp_path):
+    output_file = tmp_path / ".env.example"
+    generate_env_example(
+        required=iter(["API_KEY"]),
+        optional=("DEBUG", "API_KEY"),
+        output_path=str(output_file)
+    )
+
+    lines = output_file.read_text().splitlines()
+    assert lines.count("API_KEY=  # str") == 1
+    assert "DEBUG=  # str" in lines
+
 def test_priority_system(tmp_path, monkeypatch):
     env_file = tmp_path / ".env"
     env_file.write_text("PORT=8080")
@@ -176,3 +194,192 @@ def test_expand_vars_disabled(tmp_path):
     env_file.write_text("BASE_URL=https://example.com\nAPI_ENDPOINT=${BASE_URL}/api")
     cfg = load_env(path=str(env_file), expand_vars=False)
     assert cfg["API_ENDPOINT"] == "${BASE_URL}/api"  # Not expanded
+
+def test_parsed_env_cache_invalidation(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("PORT=8080")
+    cfg = load_env(path=str(env_file))
+    assert cfg["PORT"] == "8080"
+    
+    # Repeated loads reuse the parsed file
+    cfg = load_env(path=str(env_file))
+    assert cfg["PORT"] == "8080"
+    
+    # Changing the file invalidates the cached parse
+    env_file.write_text("PORT=90000")
+    cfg = load_env(path=str(env_file))
+    assert cfg["PORT"] == "90000"
+
+
+def test_large_env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    lines = ["# generated", ""]
+    lines += [f'KEY_{i}="value {i}"' for i in range(5000)]
+    env_file.write_text("\n".join(lines))
+    cfg = load_env(path=str(env_file), cache=False)
+    assert cfg["KEY_0"] == "value 0"
+    assert cfg["KEY_4999"] == "value 4999"
+
+
+def test_large_env_file_crlf_utf8(tmp_path):
+    env_file = tmp_path / ".env"
+    lines = [f"KEY_{i} = caf\u00e9 {i} " for i in range(5000)]
+    env_file.write_bytes("\r\n".join(lines).encode("utf-8"))
+    cfg = load_env(path=str(env_file), cache=False)
+    assert cfg["KEY_0"] == "caf\u00e9 0"
+    assert cfg["KEY_4999"] == "caf\u00e9 4999"
+
+
+def test_dotenv_line_breaks_and_quotes(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "A=1\x0bB=2\u2028C=3\rD=\"'x'\"\nE=y\"\n=empty\n",
+        encoding="utf-8",
+        newline="",
+    )
+    cfg = load_env(path=str(env_file), cache=False)
+    assert cfg["A"] == "1"
+    assert cfg["B"] == "2"
+    assert cfg["C"] == "3"
+    assert cfg["D"] == "x"
+    assert cfg["E"] == "y"
+    assert cfg[""] == "empty"
+
+def test_unicode_whitespace_same_for_small_and_large_files(tmp_path):
+    small = tmp_path / "small.env"
+    large = tmp_path / "large.env"
+    small.write_text("A=x\u00a0\n", encoding="utf-8")
+    padding = "".join(f"PAD_{i}=value\n" for i in range(8000))
+    large.write_text(padding + "A=x\u00a0\n", encoding="utf-8")
+    assert large.stat().st_size >= 64 * 1024
+    
+    assert load_env(path=str(small), cache=False)["A"] == "x"
+    assert load_env(path=str(large), cache=False)["A"] == "x"
+
+
+def test_safe_repr_tracks_mutation(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_TOKEN=abcdefgh")
+    cfg = load_env(path=str(env_file))
+    assert cfg.safe_repr()["API_TOKEN"] == "****efgh"
+    
+    cfg["API_TOKEN"] = "zzzzzzzzzz"
+    assert cfg.safe_repr()["API_TOKEN"] == "******zzzz"
+    
+    cfg.update(EXTRA="1")
+    assert cfg.safe_repr()["EXTRA"] == "1"
+
+
+def test_cast_dict(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text('LIMITS={"cpu": 2}\nBAD=[1]')
+    cfg = load_env(path=str(env_file), types={"LIMITS": dict})
+    assert cfg["LIMITS"] == {"cpu": 2}
+    with pytest.raises(EnvLoaderError):
+        load_env(path=str(env_file), types={"BAD": dict})
+
+
+def test_providers_fetched_concurrently(tmp_path):
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowProvider:
+        def __init__(self, values):
+            self.values = values
+
+        def get_all(self):
+            # Only passes if both providers are fetched at the same time
+            barrier.wait()
+            return dict(self.values)
+
+    class OtherSlowProvider(SlowProvider):
+        pass
+
+    p = tmp_path / ".env"
+    p.write_text("PORT=1")
+    cfg = load_env(path=str(p), providers=[
+        SlowProvider({"SHARED": "first", "ONE": "1"}),
+        OtherSlowProvider({"SHARED": "second", "TWO": "2"}),
+    ])
+    assert cfg["ONE"] == "1"
+    assert cfg["TWO"] == "2"
+    # Later providers still win regardless of completion order
+    assert cfg["SHARED"] == "second"
+
+
+def test_cache_get_many_set_many():
+    from env_loader_pro.core.cache import Cache
+    cache = Cache(ttl=60)
+    cache.set_many({"a": 1, "b": 2})
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    assert cache.get("a") == 1
+
+    expired = Cache(ttl=0)
+    expired.set_many({"a": 1})
+    assert expired.get_many(["a"]) == {}
+
+
+def test_star_import_excludes_optional_subsystems():
+    import env_loader_pro
+    
+    namespace = {}
+    exec("from env_loader_pro import *", namespace)
+    assert "load_env" in namespace
+    assert "config_dependency" not in env_loader_pro.__all__
+    assert "ConfigReloader" not in env_loader_pro.__all__
+    assert all(namespace[name] is not None for name in env_loader_pro.__all__)
+
+
+def test_save_json_big_int(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("BIG=1180591620717411303424")
+    cfg = load_env(path=str(env_file), types={"BIG": int})
+    
+    output_file = tmp_path / "config.json"
+    cfg.save(str(output_file), format="json")
+    assert json.loads(output_file.read_text())["BIG"] == 2 ** 70
+
+
+def test_import_does_not_load_optional_subsystems():
+    import subprocess
+    
+    src = os.path.join(os.path.dirname(__file__), '..', 'src')
+    code = (
+        "import sys, env_loader_pro\n"
+        "loaded = [m for m in sys.modules if m.split('.')[0] in ('yaml', 'orjson')\n"
+        "          or m.startswith(('env_loader_pro.crypto', 'env_loader_pro.providers'))]\n"
+        "print(','.join(sorted(loaded)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.path.abspath(src)},
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_legacy_loader_strips_one_quote_pair(tmp_path):
+    from env_loader_pro.loader import _parse_dotenv
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("A=\"'x'\"\nB=\"\"x\"\"\nC='x''\nD=\"x\"\nE='x'\nF=x")
+    parsed = _parse_dotenv(str(env_file), expand_vars=False)
+    assert parsed["A"] == "'x'"
+    assert parsed["B"] == '"x"'
+    assert parsed["C"] == "x'"
+    assert parsed["D"] == "x"
+    assert parsed["E"] == "x"
+    assert parsed["F"] == "x"
+
+
+def test_cli_error_exits_without_replacing_excepthook(tmp_path, monkeypatch, capsys):
+    from env_loader_pro.cli import main
+    
+    hook = sys.excepthook
+    output = tmp_path / "missing" / ".env.example"
+    monkeypatch.setattr(sys, "argv", ["envloader", "generate-example", "--output", str(output)])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 1
+    assert capsys.readouterr().err.startswith("Error: ")
+    assert sys.excepthook is hook
@@ -26,6 +26,38 @@ def test_policy_manager_custom():
     assert manager.get_policy("FilesystemProvider") == FailurePolicy.FALLBACK
 
 
+def test_policy_manager_set_policy():
+    """Test set_policy updates partial matching."""
+    manager = PolicyManager(policies={"azure": "warn"})
+    assert manager.get_policy("AzureKeyVaultProvider") == FailurePolicy.WARN
+    assert manager.get_policy("VaultProvider") == FailurePolicy.WARN  # default
+    
+    manager.set_policy("Azure", "fail")
+    manager.set_policy("vault", FailurePolicy.FALLBACK)
+    # First matching key in insertion order wins
+    assert manager.get_policy("AzureKeyVaultProvider") == FailurePolicy.WARN
+    assert manager.get_policy("VaultProvider") == FailurePolicy.FALLBACK
+
+
+def test_policy_manager_policies_not_stale():
+    """Test edits through the policies mapping invalidate cached lookups."""
+    manager = PolicyManager(policies={"azure": "warn"})
+    assert manager.get_policy("AzureKeyVault") == FailurePolicy.WARN
+    
+    manager.policies["azure"] = FailurePolicy.FAIL
+    assert manager.get_policy("AzureKeyVault") == FailurePolicy.FAIL
+    assert manager.should_continue("AzureKeyVault") is False
+    
+    del manager.policies["azure"]
+    assert manager.get_policy("AzureKeyVault") == FailurePolicy.WARN  # default
+    
+    manager.policies.update({"vault": FailurePolicy.FALLBACK})
+    assert manager.get_policy("AzureKeyVault") == FailurePolicy.FALLBACK
+    
+    manager.policies = {"azure": FailurePolicy.FAIL}
+    assert manager.get_policy("AzureKeyVault") == FailurePolicy.FAIL
+
+
 def test_policy_fail():
     """Test fail policy raises error."""
     manager = PolicyManager(policies={"test": "fail"})
@@ -65,6 +65,44 @@ def test_policy_from_json_file():
         os.unlink(f.name)
 
 
+def test_policy_from_file_cache():
+    """Test cached policy files are isolated and reloaded on change."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+        json.dump({"require": ["API_KEY"]}, f)
+    
+    first = Policy.from_file(f.name)
+    first.require.append("MUTATED")
+    assert Policy.from_file(f.name).require == ["API_KEY"]
+    
+    with open(f.name, 'w') as fh:
+        json.dump({"require": ["API_KEY", "DB_URL"]}, fh)
+    st = os.stat(f.name)
+    os.utime(f.name, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert Policy.from_file(f.name).require == ["API_KEY", "DB_URL"]
+    
+    os.unlink(f.name)
+
+
+def test_policy_from_file_cache_key_and_size(tmp_path, monkeypatch):
+    """Test the policy cache is keyed by absolute path and bounded."""
+    from src.env_loader_pro.core import policy_code
+    
+    monkeypatch.setattr(policy_code, "_POLICY_FILE_CACHE_MAXSIZE", 2)
+    policy_code._POLICY_FILE_CACHE.clear()
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.json").write_text(json.dumps({"require": [name]}))
+    
+    monkeypatch.chdir(tmp_path)
+    assert Policy.from_file("a.json").require == ["a"]
+    assert str(tmp_path / "a.json") in policy_code._POLICY_FILE_CACHE
+    Policy.from_file(str(tmp_path / "b.json"))
+    Policy.from_file("c.json")
+    assert list(policy_code._POLICY_FILE_CACHE) == [
+        str(tmp_path / "b.json"),
+        str(tmp_path / "c.json"),
+    ]
+
+
 def test_policy_to_dict():
     """Test policy to dictionary conversion."""
     policy = Policy(
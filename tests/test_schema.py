@@ -85,3 +85,22 @@ def test_schema_missing_required(tmp_path):
     with pytest.raises(EnvLoaderError):
         load_with_schema(Config, path=str(env_file))
 
+
+def test_extract_schema_info_cached_factories():
+    """Default factories run on every call even when the schema is cached."""
+    from dataclasses import field
+    from env_loader_pro.core.schema import extract_schema_info
+
+    @dataclass
+    class Config:
+        hosts: list = field(default_factory=list)
+        port: int = 8080
+
+    first = extract_schema_info(Config)
+    second = extract_schema_info(Config)
+    assert first == second
+    assert first["defaults"] == {"HOSTS": [], "PORT": 8080}
+    # Factories run per call, so defaults are never shared
+    assert first["defaults"]["HOSTS"] is not second["defaults"]["HOSTS"]
+    first["required"].append("X")
+    assert "X" not in extract_schema_info(Config)["required"]